@@ -6,12 +6,56 @@ This module demonstrates how to integrate Garmer with MoltBot for
 health insights and recommendations.
 """
 
-import json
-from datetime import date, datetime, timedelta
-from typing import Any
-
-from garmer import GarminClient
-from garmer.auth import AuthenticationError
+import asyncio
+import re
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any
+
+from garmer import _json
+from garmer.auth import AuthenticationError, GarminAuth
+from garmer.cache import TTLCache
+
+if TYPE_CHECKING:
+    from garmer import Activity, GarminClient, SleepData
+
+SECONDS_PER_HOUR = 3600
+ACTIVITY_LIMIT = 100  # most activities analyzed per period
+
+
+def _period(days: int) -> tuple[date, date]:
+    """Get the (start, end) dates of the period ending today."""
+    end_date = date.today()
+    return end_date - timedelta(days=days - 1), end_date
+
+
+@dataclass(slots=True)
+class _ActivityTotals:
+    """Running totals for one activity type."""
+
+    count: int = 0
+    duration_seconds: float = 0
+    distance_km: float = 0
+    calories: float = 0
+
+    def add(self, activity: "Activity") -> None:
+        """Add an activity to the totals."""
+        self.count += 1
+        self.duration_seconds += activity.duration_seconds
+        self.distance_km += activity.distance_km
+        self.calories += activity.calories
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the activity_breakdown entry format."""
+        return {
+            "count": self.count,
+            # Converted once per type rather than once per activity
+            "duration_hours": self.duration_seconds / SECONDS_PER_HOUR,
+            "distance_km": self.distance_km,
+            "calories": self.calories,
+        }
 
 
 class GarminIntegration:
@@ -22,18 +66,41 @@ class GarminIntegration:
     health insights and formatted data for AI analysis.
     """
 
-    def __init__(self, client: GarminClient | None = None):
+    def __init__(self, client: "GarminClient | None" = None, ttl_seconds: float = 300):
         """
         Initialize the Garmin integration.
 
         Args:
             client: Optional pre-configured GarminClient
+            ttl_seconds: How long computed results are reused before refetching
         """
         self._client = client
-
-    def _get_client(self) -> GarminClient:
+        # Results are keyed by day, so follow-up queries within the TTL (e.g.
+        # a summary then a briefing) reuse one fetch and never cross midnight
+        self._results = TTLCache(maxsize=32, ttl=ttl_seconds)
+
+    def invalidate(self) -> None:
+        """Discard cached results so the next query fetches fresh data."""
+        self._results.clear()
+        if self._client is not None:
+            self._client.flush_cache()
+
+    def _get_cached(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        """Return today's cached result for key, computing it if needed."""
+        key = (*key, date.today())
+        result = self._results.get(key)
+        if result is None:
+            result = compute()
+            self._results.set(key, result)
+        return result
+
+    def _get_client(self) -> "GarminClient":
         """Get or create the Garmin client."""
         if self._client is None:
+            # Imported on first use so that queries which never reach Garmin
+            # don't pay for loading the client and its HTTP stack
+            from garmer import GarminClient
+
             try:
                 self._client = GarminClient.from_saved_tokens()
             except AuthenticationError:
@@ -44,6 +111,8 @@ class GarminIntegration:
 
     def is_connected(self) -> bool:
         """Check if Garmin is connected and authenticated."""
+        if self._client is None and not GarminAuth().token_path.exists():
+            return False  # no saved tokens; no need to load the client
         try:
             self._get_client()
             return True
@@ -58,9 +127,12 @@ class GarminIntegration:
             Dictionary with formatted health data for AI processing
         """
         client = self._get_client()
-        snapshot = client.get_health_snapshot()
+        snapshot = self._get_cached(("snapshot",), client.get_health_snapshot)
+        return self._build_health_summary(snapshot)
 
-        # Format for AI consumption
+    @staticmethod
+    def _build_health_summary(snapshot: dict[str, Any]) -> dict[str, Any]:
+        """Format a health snapshot for AI consumption."""
         summary = {
             "date": snapshot["date"],
             "metrics": {},
@@ -84,12 +156,12 @@ class GarminIntegration:
         # Process sleep
         if snapshot.get("sleep"):
             sleep = snapshot["sleep"]
-            total_hours = sleep.get("total_sleep_seconds", 0) / 3600
+            total_hours = sleep.get("total_sleep_seconds", 0) / SECONDS_PER_HOUR
             summary["metrics"]["sleep"] = {
                 "hours": round(total_hours, 1),
                 "score": sleep.get("overall_score"),
-                "deep_sleep_hours": sleep.get("deep_sleep_seconds", 0) / 3600,
-                "rem_sleep_hours": sleep.get("rem_sleep_seconds", 0) / 3600,
+                "deep_sleep_hours": sleep.get("deep_sleep_seconds", 0) / SECONDS_PER_HOUR,
+                "rem_sleep_hours": sleep.get("rem_sleep_seconds", 0) / SECONDS_PER_HOUR,
             }
             if total_hours < 6:
                 summary["insights"].append("Sleep duration is below recommended 7-9 hours")
@@ -143,16 +215,23 @@ class GarminIntegration:
         Returns:
             Dictionary with activity analysis
         """
-        client = self._get_client()
-        end_date = date.today()
-        start_date = end_date - timedelta(days=days - 1)
+        return self._get_cached(
+            ("activity_insights", days), lambda: self._compute_activity_insights(days)
+        )
 
-        activities = client.get_activities(
+    def _compute_activity_insights(self, days: int) -> dict[str, Any]:
+        """Fetch activities and build the insights for get_activity_insights()."""
+        start_date, end_date = _period(days)
+        activities = self._get_client().get_activities(
             start_date=start_date,
             end_date=end_date,
-            limit=100,
+            limit=ACTIVITY_LIMIT,
         )
+        return self._build_activity_insights(days, activities)
 
+    @staticmethod
+    def _build_activity_insights(days: int, activities: list["Activity"]) -> dict[str, Any]:
+        """Build the activity insights from fetched activities."""
         insights = {
             "period_days": days,
             "total_activities": len(activities),
@@ -165,30 +244,25 @@ class GarminIntegration:
             "recommendations": [],
         }
 
-        # Analyze activities
-        activity_types: dict[str, dict[str, Any]] = {}
+        # Analyze activities per type; records are converted to dicts only
+        # for the output
+        by_type: dict[str, _ActivityTotals] = {}
         for activity in activities:
-            type_key = activity.activity_type_key
-
-            if type_key not in activity_types:
-                activity_types[type_key] = {
-                    "count": 0,
-                    "duration_hours": 0,
-                    "distance_km": 0,
-                    "calories": 0,
-                }
-
-            activity_types[type_key]["count"] += 1
-            activity_types[type_key]["duration_hours"] += activity.duration_seconds / 3600
-            activity_types[type_key]["distance_km"] += activity.distance_km
-            activity_types[type_key]["calories"] += activity.calories
-
-            insights["totals"]["duration_hours"] += activity.duration_seconds / 3600
-            insights["totals"]["distance_km"] += activity.distance_km
-            insights["totals"]["calories"] += activity.calories
+            record = by_type.get(activity.activity_type_key)
+            if record is None:
+                record = by_type[activity.activity_type_key] = _ActivityTotals()
+            record.add(activity)
 
+        activity_types = {type_key: t.to_dict() for type_key, t in by_type.items()}
         insights["activity_breakdown"] = activity_types
 
+        # Totals are the sums of the per-type figures
+        totals = insights["totals"]
+        for stats in activity_types.values():
+            totals["duration_hours"] += stats["duration_hours"]
+            totals["distance_km"] += stats["distance_km"]
+            totals["calories"] += stats["calories"]
+
         # Generate recommendations
         total_hours = insights["totals"]["duration_hours"]
 
@@ -223,12 +297,17 @@ class GarminIntegration:
         Returns:
             Dictionary with sleep trend analysis
         """
-        client = self._get_client()
-        end_date = date.today()
-        start_date = end_date - timedelta(days=days - 1)
+        return self._get_cached(("sleep_trends", days), lambda: self._compute_sleep_trends(days))
 
-        sleep_data = client._sleep.get_for_date_range(start_date, end_date)
+    def _compute_sleep_trends(self, days: int) -> dict[str, Any]:
+        """Fetch sleep data and build the analysis for get_sleep_trends()."""
+        # Per-day requests are issued concurrently (and cached) by the client
+        sleep_data = self._get_client().get_sleep_range(*_period(days))
+        return self._build_sleep_trends(days, sleep_data)
 
+    @staticmethod
+    def _build_sleep_trends(days: int, sleep_data: list["SleepData"]) -> dict[str, Any]:
+        """Build the sleep trend analysis from fetched sleep data."""
         trends = {
             "period_days": days,
             "days_with_data": len(sleep_data),
@@ -241,18 +320,24 @@ class GarminIntegration:
             trends["recommendations"].append("No sleep data available for analysis")
             return trends
 
-        # Calculate averages
-        total_sleep = sum(s.total_sleep_seconds for s in sleep_data)
-        total_deep = sum(s.deep_sleep_seconds for s in sleep_data)
-        total_rem = sum(s.rem_sleep_seconds for s in sleep_data)
-        scores = [s.overall_score for s in sleep_data if s.overall_score]
-        hrs = [s.avg_sleep_heart_rate for s in sleep_data if s.avg_sleep_heart_rate]
+        # Calculate averages in a single pass over the nights
+        total_sleep = total_deep = total_rem = 0
+        scores = []
+        hrs = []
+        for s in sleep_data:
+            total_sleep += s.total_sleep_seconds
+            total_deep += s.deep_sleep_seconds
+            total_rem += s.rem_sleep_seconds
+            if s.overall_score:
+                scores.append(s.overall_score)
+            if s.avg_sleep_heart_rate:
+                hrs.append(s.avg_sleep_heart_rate)
 
         days_count = len(sleep_data)
         trends["averages"] = {
-            "sleep_hours": round(total_sleep / days_count / 3600, 1),
-            "deep_sleep_hours": round(total_deep / days_count / 3600, 1),
-            "rem_sleep_hours": round(total_rem / days_count / 3600, 1),
+            "sleep_hours": round(total_sleep / days_count / SECONDS_PER_HOUR, 1),
+            "deep_sleep_hours": round(total_deep / days_count / SECONDS_PER_HOUR, 1),
+            "rem_sleep_hours": round(total_rem / days_count / SECONDS_PER_HOUR, 1),
             "sleep_score": round(sum(scores) / len(scores)) if scores else None,
             "sleep_hr": round(sum(hrs) / len(hrs)) if hrs else None,
         }
@@ -274,6 +359,71 @@ class GarminIntegration:
 
         return trends
 
+    def get_full_report(self, days: int = 7) -> dict[str, Any]:
+        """
+        Get the health summary, activity insights and sleep trends together.
+
+        Whatever is not already cached (the snapshot's endpoints, the
+        activity list and each night of sleep) is fetched in one concurrent
+        batch, so the wait is roughly that of the slowest request rather
+        than the sum. The results are cached for the individual getters.
+
+        Args:
+            days: Number of days to analyze for activities and sleep
+
+        Returns:
+            Dictionary with "summary", "activities" and "sleep" sections
+        """
+        today = date.today()
+        keys = {
+            "snapshot": ("snapshot", today),
+            "activities": ("activity_insights", days, today),
+            "sleep": ("sleep_trends", days, today),
+        }
+        cached = {name: self._results.get(key) for name, key in keys.items()}
+        missing = [name for name, value in cached.items() if value is None]
+
+        if missing:
+            fetched = self._fetch_report_data(days, missing)
+            if "snapshot" in fetched:
+                cached["snapshot"] = fetched["snapshot"]
+            if "activities" in fetched:
+                cached["activities"] = self._build_activity_insights(days, fetched["activities"])
+            if "sleep" in fetched:
+                cached["sleep"] = self._build_sleep_trends(days, fetched["sleep"])
+            for name in missing:
+                self._results.set(keys[name], cached[name])
+
+        return {
+            "summary": self._build_health_summary(cached["snapshot"]),
+            "activities": cached["activities"],
+            "sleep": cached["sleep"],
+        }
+
+    async def aget_full_report(self, days: int = 7) -> dict[str, Any]:
+        """Async variant of get_full_report() for hosts running an event loop."""
+        return await asyncio.to_thread(self.get_full_report, days)
+
+    def _fetch_report_data(self, days: int, names: list[str]) -> dict[str, Any]:
+        """
+        Fetch the raw data behind the named report sections concurrently.
+
+        Uses plain worker threads rather than asyncio.run(), so this also
+        works when called from a running event loop.
+        """
+        client = self._get_client()
+        start_date, end_date = _period(days)
+        fetches = {
+            "snapshot": lambda: client.get_health_snapshot(end_date),
+            "activities": lambda: client.get_activities(
+                start_date=start_date, end_date=end_date, limit=ACTIVITY_LIMIT
+            ),
+            "sleep": lambda: client.get_sleep_range(start_date, end_date),
+        }
+        with ThreadPoolExecutor(max_workers=len(names)) as pool:
+            futures = {name: pool.submit(fetches[name]) for name in names}
+            return {name: future.result() for name, future in futures.items()}
+
     def format_for_chat(self, data: dict[str, Any]) -> str:
         """
         Format health data as a chat message for MoltBot.
@@ -284,7 +434,7 @@ class GarminIntegration:
         Returns:
             Formatted string for chat display
         """
-        return json.dumps(data, indent=2, default=str)
+        return _json.dumps(data, indent=True)
 
     def get_daily_briefing(self) -> str:
         """
@@ -327,6 +477,26 @@ class GarminIntegration:
         return "\n".join(lines)
 
 
+# Query keywords per intent, matched in a single scan of the query
+_INTENT_PATTERN = re.compile(
+    r"(?P<briefing>summary|today)"
+    r"|(?P<activity>activity|exercise|workout)"
+    r"|(?P<sleep>sleep)"
+)
+
+# One integration per process, so the client, its cache and the cached
+# results are reused across handler calls
+_integration: GarminIntegration | None = None
+
+
+def get_integration() -> GarminIntegration:
+    """Get the shared GarminIntegration instance."""
+    global _integration
+    if _integration is None:
+        _integration = GarminIntegration()
+    return _integration
+
+
 # Example usage for MoltBot
 def moltbot_health_query_handler(query: str) -> str:
     """
@@ -338,21 +508,25 @@ def moltbot_health_query_handler(query: str) -> str:
     Returns:
         Response text
     """
-    integration = GarminIntegration()
+    integration = get_integration()
 
     if not integration.is_connected():
         return "Garmin is not connected. Please authenticate first."
 
-    query_lower = query.lower()
+    intents = {m.lastgroup for m in _INTENT_PATTERN.finditer(query.casefold())}
+
+    # Queries spanning several topics get everything, fetched in parallel
+    if len(intents) > 1:
+        return integration.format_for_chat(integration.get_full_report())
 
-    if "summary" in query_lower or "today" in query_lower:
+    if "briefing" in intents:
         return integration.get_daily_briefing()
 
-    if "activity" in query_lower or "exercise" in query_lower or "workout" in query_lower:
+    if "activity" in intents:
         insights = integration.get_activity_insights()
         return integration.format_for_chat(insights)
 
-    if "sleep" in query_lower:
+    if "sleep" in intents:
         trends = integration.get_sleep_trends()
         return integration.format_for_chat(trends)
 
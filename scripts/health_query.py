@@ -7,42 +7,122 @@ Usage:
     python health_query.py sleep        # Sleep analysis
     python health_query.py activities   # Recent activities
     python health_query.py snapshot     # Full health snapshot (JSON)
+    python health_query.py snapshot --compact  # Single-line JSON for machines
+
+    python health_query.py daemon       # Serve queries from a warm client
+    python health_query.py stop         # Stop a running daemon
+
+Set GARMER_COMPACT_JSON=1 to make compact JSON the default.
+
+Commands are forwarded to a background daemon that keeps one authenticated
+client and its cache alive between calls; it is started on first use and
+exits after being idle for a while. It picks up new tokens (after `garmer
+login` or `garmer logout`) on the next command. Set GARMER_DAEMON=0 to run
+every command in-process instead.
 """
 
 import json
+import os
 import sys
-from datetime import date
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import socket
 
-try:
     from garmer import GarminClient
-    from garmer.auth import AuthenticationError
-except ImportError:
-    print("Error: garmer not installed. Run: pip install garmer", file=sys.stderr)
-    sys.exit(1)
 
+SOCKET_PATH = Path.home() / ".garmer" / "garmer.sock"
+SPAWN_LOCK_PATH = Path.home() / ".garmer" / "garmer.sock.lock"
+DAEMON_IDLE_TIMEOUT = 15 * 60  # seconds
+DAEMON_START_TIMEOUT = 5.0  # seconds
+
+_client: "GarminClient | None" = None
+_client_stamp: tuple[int, ...] | None = None
+
+
+def get_client() -> "GarminClient":
+    """
+    Get authenticated Garmin client.
+
+    The client is reused for the life of the process, but recreated when the
+    saved tokens change (a new login, or a logout), so a long-running daemon
+    never keeps serving data with the previous session.
+    """
+    global _client, _client_stamp
+    stamp = _saved_token_stamp()
+    if _client is None or stamp != _client_stamp:
+        if _client is not None:
+            _client.close()
+            _client = None
+        _client = _create_client(stamp)
+        _client_stamp = stamp
+    return _client
+
+
+def _saved_token_stamp() -> tuple[int, ...] | None:
+    """Get the saved tokens' stamp, or None if garmer or the tokens are missing."""
+    try:
+        from garmer.auth import GarminAuth
+
+        return GarminAuth().token_stamp()
+    except (ImportError, FileNotFoundError):
+        return None
+
+
+def _create_client(stamp: tuple[int, ...] | None) -> "GarminClient":
+    """Create an authenticated Garmin client for the tokens with the given stamp."""
+    # Imported here so that usage/unknown-command paths don't pay for
+    # loading garmer and its HTTP stack.
+    try:
+        from garmer import GarminClient
+        from garmer.auth import AuthenticationError
+        from garmer.cache import DEFAULT_CACHE_PATH, SQLiteCache
+    except ImportError:
+        print("Error: garmer not installed. Run: pip install garmer", file=sys.stderr)
+        sys.exit(1)
+
+    if stamp is None:
+        print("Error: Not authenticated. Run 'garmer login' first.", file=sys.stderr)
+        sys.exit(1)
 
-def get_client() -> GarminClient:
-    """Get authenticated Garmin client."""
     try:
-        return GarminClient.from_saved_tokens()
+        # Responses are cached on disk so repeated invocations within the TTL
+        # window (e.g. an agent calling `summary` then `snapshot`) skip the
+        # network. Keys are scoped to the saved tokens, so entries cached for
+        # one login are never served after logging in again or as someone else.
+        namespace = "-".join(map(str, stamp))
+        cache = SQLiteCache(DEFAULT_CACHE_PATH, namespace=namespace)
+        return GarminClient.from_saved_tokens(cache=cache)
     except AuthenticationError:
         print("Error: Not authenticated. Run 'garmer login' first.", file=sys.stderr)
         sys.exit(1)
 
 
+def _write_lines(lines: list[str]) -> None:
+    """Write output lines with a single write instead of a print() per line."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def cmd_summary():
     """Print today's health summary."""
+    from datetime import date
+
     client = get_client()
     summary = client.get_daily_summary()
 
-    print(f"Date: {date.today()}")
-    print(f"Steps: {summary.total_steps:,} / {summary.daily_step_goal:,}")
-    print(f"Distance: {summary.total_distance_meters / 1000:.2f} km")
-    print(f"Calories: {summary.total_kilocalories:,}")
+    lines = [
+        f"Date: {date.today()}",
+        f"Steps: {summary.total_steps:,} / {summary.daily_step_goal:,}",
+        f"Distance: {summary.total_distance_meters / 1000:.2f} km",
+        f"Calories: {summary.total_kilocalories:,}",
+    ]
     if summary.resting_heart_rate:
-        print(f"Resting HR: {summary.resting_heart_rate} bpm")
+        lines.append(f"Resting HR: {summary.resting_heart_rate} bpm")
     if summary.avg_stress_level:
-        print(f"Avg Stress: {summary.avg_stress_level}")
+        lines.append(f"Avg Stress: {summary.avg_stress_level}")
+    _write_lines(lines)
 
 
 def cmd_sleep():
@@ -51,13 +131,16 @@ def cmd_sleep():
     sleep = client.get_sleep()
 
     if sleep:
-        print(f"Total Sleep: {sleep.total_sleep_hours:.1f} hours")
-        print(f"Deep Sleep: {sleep.deep_sleep_hours:.1f} hours")
-        print(f"REM Sleep: {sleep.rem_sleep_hours:.1f} hours")
+        lines = [
+            f"Total Sleep: {sleep.total_sleep_hours:.1f} hours",
+            f"Deep Sleep: {sleep.deep_sleep_hours:.1f} hours",
+            f"REM Sleep: {sleep.rem_sleep_hours:.1f} hours",
+        ]
         if sleep.overall_score:
-            print(f"Sleep Score: {sleep.overall_score}")
+            lines.append(f"Sleep Score: {sleep.overall_score}")
         if sleep.avg_hrv:
-            print(f"HRV: {sleep.avg_hrv:.1f} ms")
+            lines.append(f"HRV: {sleep.avg_hrv:.1f} ms")
+        _write_lines(lines)
     else:
         print("No sleep data available")
 
@@ -68,20 +151,267 @@ def cmd_activities():
     activities = client.get_recent_activities(limit=5)
 
     if activities:
+        lines = []
         for a in activities:
-            print(f"- {a.activity_name} ({a.activity_type_key})")
-            print(
+            lines.append(f"- {a.activity_name} ({a.activity_type_key})")
+            lines.append(
                 f"  Duration: {a.duration_minutes:.0f} min, Distance: {a.distance_km:.2f} km"
             )
+        _write_lines(lines)
     else:
         print("No recent activities")
 
 
 def cmd_snapshot():
     """Print full health snapshot as JSON."""
+    compact = "--compact" in sys.argv[2:]
+
     client = get_client()
     snapshot = client.get_health_snapshot()
-    print(json.dumps(snapshot, indent=2, default=str))
+
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    if orjson is not None:
+        option = 0 if compact else orjson.OPT_INDENT_2
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(snapshot, default=str, option=option) + b"\n")
+    elif compact:
+        print(json.dumps(snapshot, separators=(",", ":"), default=str))
+    else:
+        print(json.dumps(snapshot, indent=2, default=str))
+
+
+_COMMANDS: dict[str, Callable[[], None]] = {
+    "summary": cmd_summary,
+    "sleep": cmd_sleep,
+    "activities": cmd_activities,
+    "snapshot": cmd_snapshot,
+}
+
+
+# -----------------------------------------------------------------------------
+# Daemon
+# -----------------------------------------------------------------------------
+#
+# Protocol: the client sends its argv as one JSON line. The daemon replies with
+# one JSON header line {"code": <exit code>, "stderr": <text>} followed by the
+# command's raw stdout bytes, then closes the connection. ["shutdown"] asks the
+# daemon to exit after replying.
+
+
+def _run_captured(argv: list[str]) -> tuple[int, str, bytes]:
+    """Run a command in-process, capturing its exit code and output."""
+    import io
+    from contextlib import redirect_stderr, redirect_stdout
+
+    buffer = io.BytesIO()
+    stdout = io.TextIOWrapper(buffer, encoding="utf-8", write_through=True)
+    stderr = io.StringIO()
+    code = 0
+    saved_argv = sys.argv
+    sys.argv = [saved_argv[0], *argv]
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            _COMMANDS[argv[0].lower()]()
+    except SystemExit as e:
+        # Same exit status as the interpreter: None is success, and any other
+        # non-integer code is printed to stderr and exits with 1
+        if e.code is None:
+            code = 0
+        elif isinstance(e.code, int):
+            code = e.code
+        else:
+            stderr.write(f"{e.code}\n")
+            code = 1
+    except Exception as e:
+        stderr.write(f"Error: {e}\n")
+        code = 1
+    finally:
+        sys.argv = saved_argv
+    return code, stderr.getvalue(), buffer.getvalue()
+
+
+def cmd_daemon():
+    """Serve commands over a Unix socket until idle or asked to shut down."""
+    import signal
+    import socketserver
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            argv = json.loads(self.rfile.readline())
+            if argv == ["shutdown"]:
+                self.server.done = True
+                code, err, out = 0, "", b""
+            elif not argv or argv[0].lower() not in _COMMANDS:
+                code, err, out = 1, f"Unknown command: {argv}\n", b""
+            else:
+                code, err, out = _run_captured(argv)
+            header = json.dumps({"code": code, "stderr": err}).encode()
+            self.wfile.write(header + b"\n" + out)
+
+    class Server(socketserver.UnixStreamServer):
+        timeout = DAEMON_IDLE_TIMEOUT
+        done = False
+
+        def handle_timeout(self):
+            self.done = True
+
+    # Never take over the socket of a daemon that is still serving
+    sock = _connect_to_daemon()
+    if sock is not None:
+        sock.close()
+        return
+
+    SOCKET_PATH.parent.mkdir(parents=True, exist_ok=True)
+    SOCKET_PATH.unlink(missing_ok=True)
+    old_umask = os.umask(0o077)  # socket is only usable by the owner
+    try:
+        server = Server(str(SOCKET_PATH), Handler)
+    finally:
+        os.umask(old_umask)
+    socket_inode = SOCKET_PATH.stat().st_ino
+
+    # Remove the socket on `kill` as well as on idle shutdown
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    # Requests are handled one at a time: commands redirect the process-wide
+    # stdout, and the client is shared.
+    with server:
+        try:
+            while not server.done:
+                server.handle_request()
+        finally:
+            # Only remove the socket if it is still ours
+            try:
+                if SOCKET_PATH.stat().st_ino == socket_inode:
+                    SOCKET_PATH.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def cmd_stop():
+    """Ask a running daemon to exit."""
+    import socket
+
+    sock = None
+    if hasattr(socket, "AF_UNIX"):
+        try:
+            sock = _connect_to_daemon()
+        except OSError:
+            pass
+    if sock is None:
+        print("No daemon running")
+        return
+
+    with sock, sock.makefile("rb") as response:
+        sock.sendall(json.dumps(["shutdown"]).encode() + b"\n")
+        response.readline()  # wait until the daemon has taken the request
+    print("Daemon stopped")
+
+
+def _spawn_daemon() -> None:
+    """Start the daemon in the background, detached from this process."""
+    import subprocess
+
+    subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "daemon"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def _connect_to_daemon() -> "socket.socket | None":
+    """
+    Connect to the daemon's socket.
+
+    Returns:
+        The connected socket, or None if no daemon is listening
+
+    Raises:
+        OSError: If the socket exists but cannot be used
+    """
+    import socket
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(SOCKET_PATH))
+        return sock
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+    except OSError:
+        sock.close()
+        raise
+
+
+def _start_daemon() -> "socket.socket | None":
+    """
+    Start the daemon and connect to it.
+
+    Startup is serialized with an exclusive lock, so that concurrent first
+    calls spawn a single daemon; callers that waited for the lock connect to
+    the daemon started by the first one.
+
+    Returns:
+        The connected socket, or None if the daemon did not come up in time
+    """
+    import fcntl
+    import time
+
+    SPAWN_LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(SPAWN_LOCK_PATH, "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        sock = _connect_to_daemon()
+        if sock is not None:
+            return sock
+
+        _spawn_daemon()
+        deadline = time.monotonic() + DAEMON_START_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            sock = _connect_to_daemon()
+            if sock is not None:
+                return sock
+    return None
+
+
+def _forward_to_daemon(argv: list[str]) -> int | None:
+    """
+    Run a command through the daemon, starting it if needed.
+
+    Returns:
+        The command's exit code, or None if the daemon is unavailable and the
+        command should be run in-process
+    """
+    import socket
+
+    if os.environ.get("GARMER_DAEMON") == "0" or not hasattr(socket, "AF_UNIX"):
+        return None
+
+    try:
+        sock = _connect_to_daemon() or _start_daemon()
+    except (ImportError, OSError):  # no fcntl, or an unusable socket
+        return None
+    if sock is None:
+        return None
+
+    with sock, sock.makefile("rb") as response:
+        sock.sendall(json.dumps(argv).encode() + b"\n")
+        header_line = response.readline()
+        if not header_line:
+            return None  # daemon went away mid-request
+        header = json.loads(header_line)
+        payload = response.read()
+
+    sys.stderr.write(header["stderr"])
+    sys.stdout.flush()
+    sys.stdout.buffer.write(payload)
+    return header["code"]
 
 
 def main():
@@ -90,21 +420,30 @@ def main():
         sys.exit(0)
 
     command = sys.argv[1].lower()
+    if command == "daemon":
+        cmd_daemon()
+        return
+    if command == "stop":
+        cmd_stop()
+        return
 
-    commands = {
-        "summary": cmd_summary,
-        "sleep": cmd_sleep,
-        "activities": cmd_activities,
-        "snapshot": cmd_snapshot,
-    }
-
-    if command in commands:
-        commands[command]()
-    else:
+    handler = _COMMANDS.get(command)
+    if handler is None:
         print(f"Unknown command: {command}")
         print(__doc__)
         sys.exit(1)
 
+    # Resolve environment switches into arguments here, since a daemon only
+    # sees argv and its own environment is that of whoever started it
+    if os.environ.get("GARMER_COMPACT_JSON") == "1" and "--compact" not in sys.argv[2:]:
+        sys.argv.append("--compact")
+
+    code = _forward_to_daemon(sys.argv[1:])
+    if code is not None:
+        sys.exit(code)
+
+    handler()
+
 
 if __name__ == "__main__":
     main()
@@ -5,16 +5,19 @@ This package provides a clean interface to extract health and fitness data
 from Garmin Connect, including activities, sleep, heart rate, stress, and more.
 """
 
-from garmer.client import GarminClient
-from garmer.models import (
-    Activity,
-    DailySummary,
-    HeartRateData,
-    SleepData,
-    StepsData,
-    StressData,
-    UserProfile,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from garmer.client import GarminClient
+    from garmer.models import (
+        Activity,
+        DailySummary,
+        HeartRateData,
+        SleepData,
+        StepsData,
+        StressData,
+        UserProfile,
+    )
 
 __version__ = "0.1.0"
 __all__ = [
@@ -27,3 +30,33 @@ __all__ = [
     "StressData",
     "UserProfile",
 ]
+
+# Exports are resolved on first access (PEP 562) so that `import garmer`, or
+# importing a light submodule such as garmer.cache, doesn't load the client,
+# the models and the HTTP stack up front.
+_LAZY_EXPORTS = {
+    "GarminClient": "garmer.client",
+    "Activity": "garmer.models",
+    "DailySummary": "garmer.models",
+    "HeartRateData": "garmer.models",
+    "SleepData": "garmer.models",
+    "StepsData": "garmer.models",
+    "StressData": "garmer.models",
+    "UserProfile": "garmer.models",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS])
@@ -0,0 +1,75 @@
+"""
+JSON encoding and decoding for the whole package, using orjson when installed.
+
+Used for CLI output, data exports and the config file.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the "fast" extra
+    orjson = None
+
+if orjson is not None:
+    # Hand dates and dataclasses to default=str so the output matches the
+    # stdlib encoder; allow non-str keys as json.dumps does.
+    _OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def dumpb(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize obj to UTF-8 encoded JSON.
+
+    Values that are not natively serializable (dates, enums, ...) are
+    converted with str().
+
+    Args:
+        obj: Object to serialize
+        indent: Indent nested structures by two spaces
+
+    Returns:
+        The JSON document as bytes
+    """
+    if orjson is not None:
+        option = _OPTIONS | orjson.OPT_INDENT_2 if indent else _OPTIONS
+        return orjson.dumps(obj, default=str, option=option)
+    return dumps(obj, indent).encode()
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize obj to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        indent: Indent nested structures by two spaces
+
+    Returns:
+        The JSON document
+    """
+    if orjson is not None:
+        return dumpb(obj, indent).decode()
+    if indent:
+        return json.dumps(obj, indent=2, default=str)
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        The decoded object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
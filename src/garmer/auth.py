@@ -1,14 +1,64 @@
 """Authentication handler for Garmin Connect using garth library."""
 
 import logging
+import os
+import shutil
+import tempfile
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import garth
-from garth.exc import GarthException, GarthHTTPError
+if TYPE_CHECKING:
+    import garth
+
+# garth (and the requests stack under it) is imported where it is used, so
+# that importing garmer stays cheap for code paths that never hit the API.
 
 logger = logging.getLogger(__name__)
 
+# Tokens already loaded in this process, keyed by token path, with the token
+# files' modification times so that changes on disk are picked up
+_TOKEN_CACHE: dict[Path, tuple[tuple[int, ...], Any, Any]] = {}
+
+# HTTP policy for Garmin requests. The timeout and retry count come from
+# GarmerConfig; rate limiting (429, honouring Retry-After) and transient server
+# errors are retried with exponential backoff rather than failing the request
+# or retrying at once.
+RETRY_STATUS_CODES = (408, 429, 500, 502, 503, 504)
+RETRY_BACKOFF_FACTOR = 1.0
+# Room for the client's async workers plus the extractors' date-range workers,
+# so concurrent requests keep their connections alive instead of discarding
+# them when the pool is full
+POOL_MAXSIZE = 16
+
+# (timeout, retries) last applied to garth's session
+_http_settings: tuple[int, int] | None = None
+
+
+def _configure_http(timeout: int, retries: int) -> None:
+    """
+    Apply the timeout and retry policy to garth's shared HTTP session.
+
+    The session is only reconfigured when the settings change.
+
+    Args:
+        timeout: Request timeout in seconds
+        retries: Maximum number of retries per request
+    """
+    global _http_settings
+    if _http_settings == (timeout, retries):
+        return
+
+    import garth
+
+    garth.configure(
+        timeout=timeout,
+        retries=retries,
+        status_forcelist=RETRY_STATUS_CODES,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        pool_maxsize=POOL_MAXSIZE,
+    )
+    _http_settings = (timeout, retries)
+
 
 class AuthenticationError(Exception):
     """Raised when authentication with Garmin Connect fails."""
@@ -37,6 +87,8 @@ class GarminAuth:
         self,
         token_dir: Path | str | None = None,
         token_file: str | None = None,
+        request_timeout: int | None = None,
+        max_retries: int | None = None,
     ):
         """
         Initialize the authentication handler.
@@ -45,10 +97,29 @@ class GarminAuth:
             token_dir: Directory to store authentication tokens.
                       Defaults to ~/.garmer
             token_file: Name of the token file. Defaults to 'garmin_tokens'
+            request_timeout: Request timeout in seconds. Defaults to the
+                             configured request_timeout (see load_config())
+            max_retries: Maximum retries per request. Defaults to the
+                         configured max_retries
         """
         self.token_dir = Path(token_dir) if token_dir else self.DEFAULT_TOKEN_DIR
         self.token_file = token_file or self.DEFAULT_TOKEN_FILE
+        self.request_timeout = request_timeout
+        self.max_retries = max_retries
         self._is_authenticated = False
+        # OAuth2 token as last written to (or read from) disk
+        self._saved_oauth2_token: Any = None
+
+    def _configure_http(self) -> None:
+        """Apply this handler's (or the configured) HTTP policy to garth."""
+        timeout, retries = self.request_timeout, self.max_retries
+        if timeout is None or retries is None:
+            from garmer.config import load_config
+
+            config = load_config()
+            timeout = config.request_timeout if timeout is None else timeout
+            retries = config.max_retries if retries is None else retries
+        _configure_http(timeout, retries)
 
     @property
     def token_path(self) -> Path:
@@ -75,6 +146,10 @@ class GarminAuth:
         Raises:
             AuthenticationError: If authentication fails
         """
+        import garth
+        from garth.exc import GarthException, GarthHTTPError
+
+        self._configure_http()
         try:
             logger.info("Attempting to log in to Garmin Connect...")
             garth.login(email, password)
@@ -100,11 +175,21 @@ class GarminAuth:
         """
         Save authentication tokens to disk.
 
-        Creates the token directory if it doesn't exist.
+        Creates the token directory if it doesn't exist. Tokens are written
+        to a temporary directory first and then moved into place, so an
+        interrupted save never leaves truncated token files behind.
         """
+        import garth
+
         try:
             self.token_dir.mkdir(parents=True, exist_ok=True)
-            garth.save(self.token_path)
+            with tempfile.TemporaryDirectory(dir=self.token_dir, prefix=".tokens-") as tmp:
+                garth.save(tmp)
+                self.token_path.mkdir(exist_ok=True)
+                for token_file in Path(tmp).iterdir():
+                    os.replace(token_file, self.token_path / token_file.name)
+            _TOKEN_CACHE.pop(self.token_path, None)
+            self._saved_oauth2_token = garth.client.oauth2_token
             logger.info(f"Saved authentication tokens to {self.token_path}")
         except Exception as e:
             logger.warning(f"Failed to save tokens: {e}")
@@ -113,15 +198,41 @@ class GarminAuth:
         """
         Load authentication tokens from disk.
 
+        Tokens already loaded by this process are reused unless the files
+        have changed since, and nothing is done if already authenticated.
+
         Returns:
             True if tokens were loaded successfully and are valid
         """
-        if not self.token_path.exists():
+        if self._is_authenticated:
+            return True
+
+        try:
+            stamp = self.token_stamp()
+        except FileNotFoundError:
             logger.debug(f"No token file found at {self.token_path}")
             return False
 
+        import garth
+        from garth.exc import GarthException
+
+        self._configure_http()
         try:
-            garth.resume(self.token_path)
+            cached = _TOKEN_CACHE.get(self.token_path)
+            if cached is not None and cached[0] == stamp:
+                _, oauth1, oauth2 = cached
+                if garth.client.oauth1_token is not oauth1:
+                    garth.client.configure(
+                        oauth1_token=oauth1, oauth2_token=oauth2, domain=oauth1.domain
+                    )
+            else:
+                garth.resume(self.token_path)
+                _TOKEN_CACHE[self.token_path] = (
+                    stamp,
+                    garth.client.oauth1_token,
+                    garth.client.oauth2_token,
+                )
+            self._saved_oauth2_token = garth.client.oauth2_token
             self._is_authenticated = True
             logger.info("Successfully loaded authentication tokens")
             return True
@@ -140,14 +251,58 @@ class GarminAuth:
             delete_tokens: Whether to delete the saved token file
         """
         self._is_authenticated = False
+        _TOKEN_CACHE.pop(self.token_path, None)
 
-        if delete_tokens and self.token_path.exists():
+        if delete_tokens:
             try:
-                self.token_path.unlink()
-                logger.info("Deleted authentication tokens")
-            except Exception as e:
+                if self.delete_tokens():
+                    logger.info("Deleted authentication tokens")
+            except OSError as e:
                 logger.warning(f"Failed to delete tokens: {e}")
 
+    def delete_tokens(self) -> bool:
+        """
+        Delete the saved tokens.
+
+        Deletion is attempted directly rather than after an existence check.
+
+        Returns:
+            True if tokens were deleted, False if none were saved
+
+        Raises:
+            OSError: If the tokens exist but could not be deleted
+        """
+        _TOKEN_CACHE.pop(self.token_path, None)
+        try:
+            # garth saves a directory of token files
+            shutil.rmtree(self.token_path)
+        except NotADirectoryError:
+            self.token_path.unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def token_stamp(self) -> tuple[int, ...]:
+        """
+        Get the modification times of the saved token file(s).
+
+        The stamp changes whenever the tokens are saved again (a new login or
+        a token refresh), so it can be used to invalidate state derived from
+        the current session.
+
+        Returns:
+            Modification times in nanoseconds, one per token file
+
+        Raises:
+            FileNotFoundError: If no tokens are saved
+        """
+        path = self.token_path
+        try:
+            files = sorted(path.iterdir())
+        except NotADirectoryError:
+            files = [path]
+        return tuple(f.stat().st_mtime_ns for f in files)
+
     def ensure_authenticated(self) -> None:
         """
         Ensure we have valid authentication.
@@ -174,10 +329,13 @@ class GarminAuth:
         Returns:
             True if refresh was successful or not needed
         """
+        import garth
+        from garth.exc import GarthException
+
         try:
             # garth handles token refresh automatically
             # This method can be called to ensure tokens are current
-            if self._is_authenticated:
+            if self._is_authenticated and garth.client.oauth2_token != self._saved_oauth2_token:
                 self.save_tokens()  # Save refreshed tokens
             return True
         except GarthException as e:
@@ -185,7 +343,7 @@ class GarminAuth:
             self._is_authenticated = False
             return False
 
-    def get_client(self) -> garth.Client:
+    def get_client(self) -> "garth.Client":
         """
         Get the underlying garth client for direct API calls.
 
@@ -195,6 +353,8 @@ class GarminAuth:
         Raises:
             AuthenticationError: If not authenticated
         """
+        import garth
+
         self.ensure_authenticated()
         return garth.client
 
@@ -221,6 +381,9 @@ class GarminAuth:
             AuthenticationError: If not authenticated
             SessionExpiredError: If the session has expired
         """
+        import garth
+        from garth.exc import GarthException, GarthHTTPError
+
         self.ensure_authenticated()
 
         try:
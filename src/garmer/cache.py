@@ -0,0 +1,246 @@
+"""Response caching for Garmin Connect API calls."""
+
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# Default location of the persistent response cache shared by garmer tools
+DEFAULT_CACHE_PATH = Path.home() / ".garmer" / "cache" / "responses.sqlite3"
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache with per-entry expiry.
+
+    Entries expire once their time-to-live has elapsed. When the cache is
+    full, the least recently used entry is evicted to make room.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+            ttl: Default time-to-live in seconds for new entries
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value to return if the key is missing or expired
+
+        Returns:
+            The cached value or default
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live in seconds (defaults to the cache's ttl)
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache:
+    """
+    Persistent cache with per-entry expiry backed by a SQLite file.
+
+    Has the same interface as TTLCache, but entries survive across
+    processes. This lets short-lived CLI invocations reuse responses
+    fetched by a previous run within the TTL window.
+    """
+
+    def __init__(self, path: Path | str, ttl: float = 60.0, namespace: str = ""):
+        """
+        Open (or create) the cache database.
+
+        Expired entries are evicted when the cache is opened.
+
+        Args:
+            path: Path to the SQLite database file
+            ttl: Default time-to-live in seconds for new entries
+            namespace: Prefix for all keys, e.g. identifying the account or
+                       session, so entries stored under one namespace are
+                       never returned under another
+        """
+        self.path = Path(path).expanduser()
+        self.ttl = ttl
+        self.namespace = namespace
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value BLOB, expires_at REAL)"
+            )
+            self._conn.execute("DELETE FROM cache WHERE expires_at < ?", (time.time(),))
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value to return if the key is missing, expired or unreadable
+
+        Returns:
+            The cached value or default
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (self._key(key),)
+            ).fetchone()
+        if row is None or row[1] <= time.time():
+            return default
+        try:
+            return pickle.loads(row[0])
+        except Exception as e:
+            logger.debug(f"Discarding unreadable cache entry {key!r}: {e}")
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Value to store (must be picklable)
+            ttl: Time-to-live in seconds (defaults to the cache's ttl)
+        """
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (self._key(key), data, expires_at),
+            )
+
+    def clear(self) -> None:
+        """Remove all entries from the cache, in every namespace."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache")
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def _key(self, key: Hashable) -> str:
+        """Get the stored form of a key."""
+        return f"{self.namespace}:{key!r}" if self.namespace else repr(key)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+
+class RequestCoalescer:
+    """
+    Share raw API responses between callers requesting the same endpoint.
+
+    Several extractors read the same endpoint (e.g. daily summary and steps
+    both parse /usersummary/daily). Concurrent callers for the same key wait
+    on a single in-flight request, and the response is kept for a short
+    window so that sequential callers reuse it too.
+    """
+
+    def __init__(self, ttl: float = 5.0, maxsize: int = 128):
+        """
+        Initialize the coalescer.
+
+        Args:
+            ttl: How long a completed response is shared, in seconds
+            maxsize: Maximum number of responses to keep
+        """
+        self._responses = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._inflight: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """
+        Return the response for key, calling fetch only if nobody else is.
+
+        Args:
+            key: Identifies the request (e.g. endpoint and parameters)
+            fetch: Performs the request; called at most once per window
+
+        Returns:
+            The (possibly shared) response
+
+        Raises:
+            Whatever fetch raises, for the caller and all waiters
+        """
+        with self._lock:
+            cached = self._responses.get(key, _MISSING)
+            if cached is not _MISSING:
+                return cached
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            self._responses.set(key, result)
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def clear(self) -> None:
+        """Forget all shared responses."""
+        self._responses.clear()
@@ -1,74 +1,187 @@
 """Command-line interface for Garmer."""
 
 import argparse
-import getpass
-import json
 import logging
-import subprocess
+import os
 import sys
-from datetime import date, datetime, timedelta
-from pathlib import Path
+from collections.abc import Callable, Iterable
+from datetime import date, timedelta
+from functools import lru_cache, wraps
+from operator import attrgetter, itemgetter
+from typing import TYPE_CHECKING, Any, BinaryIO
 
-from garmer.auth import AuthenticationError
-from garmer.client import GarminClient
-from garmer.config import load_config
+if TYPE_CHECKING:
+    from garmer.client import GarminClient
 
 logger = logging.getLogger(__name__)
 
+SECONDS_PER_HOUR = 3600
 
-def _get_package_root() -> Path | None:
-    """Get the root directory of the garmer package (where .git lives)."""
-    # First, try walking up from this file's location (works for editable installs)
-    current = Path(__file__).resolve().parent
+
+@lru_cache(maxsize=1)
+def _get_package_root() -> str | None:
+    """
+    Get the root directory of the garmer package (where .git lives).
+
+    The GARMER_ROOT environment variable overrides the search. The result
+    is cached for the lifetime of the process, and a root found by the slow
+    search is also remembered on disk for later runs.
+    """
+    env_root = os.environ.get("GARMER_ROOT")
+    if env_root:
+        return os.path.expanduser(env_root)
+
+    # First, try walking up from this file's location (works for editable installs).
+    # abspath is enough here; resolving symlinks would stat every component.
+    current = os.path.dirname(os.path.abspath(__file__))
     for _ in range(5):  # Walk up at most 5 levels
-        if (current / ".git").exists():
+        if os.path.exists(os.path.join(current, ".git")):
             return current
-        current = current.parent
+        current = os.path.dirname(current)
+
+    # Then the location found by a previous run, if it is still a checkout
+    cache_file = _cache_file("package_root")
+    try:
+        with open(cache_file) as f:
+            cached_root = f.read().strip()
+        if cached_root and os.path.exists(os.path.join(cached_root, ".git")):
+            return cached_root
+    except OSError:
+        pass
+
+    root = _find_installed_package_root()
+    if root:
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, "w") as f:
+                f.write(root)
+        except OSError as e:
+            logger.debug(f"Could not cache package root: {e}")
+    return root
+
+
+def _cache_file(name: str) -> str:
+    """Get the path of a file the CLI keeps between runs in the user cache."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "garmer", name)
 
-    # Check common source locations
-    common_locations = [
-        Path.home() / ".openclaw" / "skills" / "garmer",
-        Path.home() / "Desktop" / "code" / "garmer",
-        Path.home() / "code" / "garmer",
-        Path.home() / "projects" / "garmer",
-    ]
 
-    for location in common_locations:
-        if (location / ".git").exists():
-            return location
+def _find_installed_package_root() -> str | None:
+    """
+    Search for the source checkout of a garmer that is not run from it.
 
-    # Try to find from pip's direct_url.json (for editable installs)
+    Only pip's record of where the package was installed from is consulted;
+    checkouts elsewhere are found by setting GARMER_ROOT.
+    """
     try:
         import importlib.metadata
 
-        dist = importlib.metadata.distribution("garmer")
-        direct_url_file = dist._path.parent / "direct_url.json"  # type: ignore
-        if direct_url_file.exists():
-            import json
-
-            with open(direct_url_file) as f:
-                data = json.load(f)
-                if "url" in data and data["url"].startswith("file://"):
-                    source_path = Path(data["url"].replace("file://", ""))
-                    if (source_path / ".git").exists():
-                        return source_path
+        from garmer import _json
+
+        direct_url = importlib.metadata.distribution("garmer").read_text("direct_url.json")
+        if direct_url:
+            data = _json.loads(direct_url)
+            if "url" in data and data["url"].startswith("file://"):
+                source_path = data["url"].replace("file://", "")
+                if os.path.exists(os.path.join(source_path, ".git")):
+                    return source_path
     except Exception:
         pass
 
     return None
 
 
+@lru_cache(maxsize=1)
+def _client() -> "GarminClient":
+    """
+    Get the client shared by all commands run in this process.
+
+    Tokens are read and the HTTP session is set up once. A failed attempt
+    raises and is not cached, so a later call retries.
+    """
+    from garmer.client import GarminClient
+
+    return GarminClient.from_saved_tokens()
+
+
+def _parse_date(value: str) -> date:
+    """Parse a YYYY-MM-DD command-line date (used as an argparse type)."""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid date: {value!r} (expected YYYY-MM-DD)"
+        ) from None
+
+
+def _yesterday() -> date:
+    """Get yesterday's date, the default for date-based commands."""
+    return date.fromordinal(date.today().toordinal() - 1)
+
+
+def _with_client_and_date(
+    func: Callable[[argparse.Namespace, "GarminClient", date], int],
+) -> Callable[[argparse.Namespace], int]:
+    """
+    Decorate a command that needs the shared client and a --date.
+
+    The wrapped command is called with the client and the parsed date, which
+    defaults to yesterday to avoid timezone issues and ensure complete data.
+    """
+
+    @wraps(func)
+    def wrapper(args: argparse.Namespace) -> int:
+        from garmer.auth import AuthenticationError
+
+        try:
+            client = _client()
+        except AuthenticationError:
+            print("Not logged in. Use 'garmer login' first.", file=sys.stderr)
+            return 1
+
+        target_date = args.date or _yesterday()
+        return func(args, client, target_date)
+
+    return wrapper
+
+
+def _write_json(data: Any, indent: bool = False) -> None:
+    """Write data to stdout as JSON, passing the encoded bytes straight through."""
+    from garmer import _json
+
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_json.dumpb(data, indent) + b"\n")
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Write output lines with a single write instead of a print() per line."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def setup_logging(verbose: bool = False) -> None:
-    """Set up logging for CLI."""
-    level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(
-        level=level,
-        format="%(levelname)s: %(message)s",
-    )
+    """
+    Set up logging for CLI.
+
+    Commands print their own results, so logging is only configured for
+    --verbose. Otherwise warnings and errors still reach stderr through
+    logging's last-resort handler.
+    """
+    if verbose:
+        logging.basicConfig(
+            level=logging.DEBUG,
+            format="%(levelname)s: %(message)s",
+        )
 
 
 def cmd_login(args: argparse.Namespace) -> int:
     """Handle login command."""
+    import getpass
+
+    from garmer.auth import AuthenticationError
+    from garmer.client import GarminClient
+
     email = args.email or input("Garmin Connect email: ")
     password = args.password or getpass.getpass("Garmin Connect password: ")
 
@@ -78,6 +191,8 @@ def cmd_login(args: argparse.Namespace) -> int:
             password=password,
             save_tokens=True,
         )
+        _client.cache_clear()
+        _clear_response_cache()
         print("Successfully logged in and saved authentication tokens.")
         return 0
     except AuthenticationError as e:
@@ -87,46 +202,106 @@ def cmd_login(args: argparse.Namespace) -> int:
 
 def cmd_logout(args: argparse.Namespace) -> int:
     """Handle logout command."""
+    from garmer.auth import GarminAuth
+    from garmer.config import load_config
+
     config = load_config()
-    token_path = config.token_dir / config.token_file
+    auth = GarminAuth(token_dir=config.token_dir, token_file=config.token_file)
 
-    if token_path.exists():
-        token_path.unlink()
+    _client.cache_clear()
+    _clear_response_cache()
+    try:
+        deleted = auth.delete_tokens()
+    except OSError as e:
+        print(f"Failed to delete tokens: {e}", file=sys.stderr)
+        return 1
+
+    if deleted:
         print("Logged out and deleted saved tokens.")
     else:
         print("No saved tokens found.")
     return 0
 
 
+def _clear_response_cache() -> None:
+    """Drop API responses cached on disk for the previous session."""
+    import sqlite3
+
+    from garmer.cache import DEFAULT_CACHE_PATH, SQLiteCache
+
+    if not DEFAULT_CACHE_PATH.exists():
+        return
+    try:
+        cache = SQLiteCache(DEFAULT_CACHE_PATH)
+        cache.clear()
+        cache.close()
+    except sqlite3.Error as e:
+        logger.debug(f"Could not clear response cache: {e}")
+
+
 def cmd_status(args: argparse.Namespace) -> int:
-    """Handle status command."""
+    """
+    Handle status command.
+
+    The profile is remembered in the user cache together with the token
+    files' modification times, so repeated calls skip the API until the
+    tokens change (e.g. after a new login).
+    """
+    from garmer import _json
+    from garmer.auth import AuthenticationError, GarminAuth
+
+    try:
+        token_stamp = list(GarminAuth().token_stamp())
+    except FileNotFoundError:
+        token_stamp = None
+
+    cache_file = _cache_file("profile.json")
+    if token_stamp:
+        try:
+            with open(cache_file, "rb") as f:
+                cached = _json.loads(f.read())
+            if cached.get("token_stamp") == token_stamp:
+                _write_status(cached["display_name"] or cached["email"], cached["profile_id"])
+                return 0
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
     try:
-        client = GarminClient.from_saved_tokens()
+        client = _client()
         profile = client.get_user_profile()
-        if profile:
-            print(f"Logged in as: {profile.display_name or profile.email}")
-            print(f"User ID: {profile.profile_id}")
-        else:
-            print("Authenticated but could not retrieve profile.")
-        return 0
     except AuthenticationError:
         print("Not logged in. Use 'garmer login' to authenticate.")
         return 1
 
+    if not profile:
+        print("Authenticated but could not retrieve profile.")
+        return 0
 
-def cmd_summary(args: argparse.Namespace) -> int:
-    """Handle summary command."""
-    try:
-        client = GarminClient.from_saved_tokens()
-    except AuthenticationError:
-        print("Not logged in. Use 'garmer login' first.", file=sys.stderr)
-        return 1
+    _write_status(profile.display_name or profile.email, profile.profile_id)
+    if token_stamp:
+        cached = {
+            "token_stamp": token_stamp,
+            "display_name": profile.display_name,
+            "profile_id": profile.profile_id,
+            "email": profile.email,
+        }
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, "wb") as f:
+                f.write(_json.dumpb(cached))
+        except OSError as e:
+            logger.debug(f"Could not cache profile: {e}")
+    return 0
+
+
+def _write_status(name: str | None, profile_id: Any) -> None:
+    """Write the status command's output."""
+    _write_lines([f"Logged in as: {name}", f"User ID: {profile_id}"])
 
-    # Default to yesterday to avoid timezone issues and ensure complete data
-    target_date = args.date or (date.today() - timedelta(days=1))
-    if isinstance(target_date, str):
-        target_date = datetime.strptime(target_date, "%Y-%m-%d").date()
 
+@_with_client_and_date
+def cmd_summary(args: argparse.Namespace, client: "GarminClient", target_date: date) -> int:
+    """Handle summary command."""
     summary = client.get_daily_summary(target_date)
 
     # Optionally fetch sleep data for a complete picture
@@ -136,11 +311,18 @@ def cmd_summary(args: argparse.Namespace) -> int:
 
     if not summary:
         if args.json:
-            print(json.dumps({"date": str(target_date), "error": "No data available"}))
+            _write_json({"date": str(target_date), "error": "No data available"})
         else:
             print(f"No data available for {target_date}")
         return 1
 
+    # Values shared by both output formats
+    step_pct = summary.step_goal_percentage
+    distance_km = summary.total_distance_meters / 1000
+    highly_active_seconds = summary.highly_active_seconds
+    active_seconds = summary.active_seconds
+    sedentary_hours = summary.sedentary_seconds / SECONDS_PER_HOUR
+
     # JSON output for programmatic access (OpenClaw, scripts, etc.)
     if args.json:
         data = {
@@ -148,10 +330,10 @@ def cmd_summary(args: argparse.Namespace) -> int:
             "steps": {
                 "total": summary.total_steps,
                 "goal": summary.daily_step_goal,
-                "goal_percentage": round(summary.step_goal_percentage, 1),
+                "goal_percentage": round(step_pct, 1),
                 "goal_reached": summary.total_steps >= summary.daily_step_goal,
             },
-            "distance_km": round(summary.total_distance_meters / 1000, 2),
+            "distance_km": round(distance_km, 2),
             "calories": {
                 "total": summary.total_kilocalories,
                 "active": summary.active_kilocalories,
@@ -198,9 +380,9 @@ def cmd_summary(args: argparse.Namespace) -> int:
             },
             "hrv_status": summary.hrv_status,
             "activity_time": {
-                "highly_active_hours": round(summary.highly_active_seconds / 3600, 2),
-                "active_hours": round(summary.active_seconds / 3600, 2),
-                "sedentary_hours": round(summary.sedentary_seconds / 3600, 2),
+                "highly_active_hours": round(highly_active_seconds / SECONDS_PER_HOUR, 2),
+                "active_hours": round(active_seconds / SECONDS_PER_HOUR, 2),
+                "sedentary_hours": round(sedentary_hours, 2),
             },
             "activities_count": summary.activities_count,
         }
@@ -210,27 +392,28 @@ def cmd_summary(args: argparse.Namespace) -> int:
                 "deep_hours": round(sleep.deep_sleep_hours, 2),
                 "light_hours": round(sleep.light_sleep_hours, 2),
                 "rem_hours": round(sleep.rem_sleep_hours, 2),
-                "awake_hours": round(sleep.awake_hours, 2),
+                "awake_hours": round(sleep.awake_seconds / SECONDS_PER_HOUR, 2),
                 "score": sleep.overall_score,
                 "avg_hr": sleep.avg_sleep_heart_rate,
                 "avg_hrv": sleep.avg_hrv,
             }
-        print(json.dumps(data, indent=2))
+        _write_json(data, indent=True)
         return 0
 
-    # Human-readable output
-    print(f"\n=== Daily Summary for {target_date} ===\n")
+    # Human-readable output, written in one go
+    lines: list[str] = []
+    out = lines.append
+    out(f"\n=== Daily Summary for {target_date} ===\n")
 
     # Steps with goal percentage
-    step_pct = summary.step_goal_percentage
     step_status = "achieved" if step_pct >= 100 else f"{step_pct:.0f}%"
-    print(
+    out(
         f"Steps: {summary.total_steps:,} / {summary.daily_step_goal:,} ({step_status})"
     )
-    print(f"Distance: {summary.total_distance_meters / 1000:.2f} km")
+    out(f"Distance: {distance_km:.2f} km")
 
     # Calories
-    print(
+    out(
         f"Calories: {summary.total_kilocalories:,} (Active: {summary.active_kilocalories:,}, BMR: {summary.bmr_kilocalories:,})"
     )
 
@@ -240,7 +423,7 @@ def cmd_summary(args: argparse.Namespace) -> int:
         if summary.floors_ascended_goal > 0
         else 0
     )
-    print(
+    out(
         f"Floors: {summary.floors_ascended:.0f} / {summary.floors_ascended_goal} ({floors_pct:.0f}%)"
     )
 
@@ -253,16 +436,15 @@ def cmd_summary(args: argparse.Namespace) -> int:
     if summary.avg_heart_rate:
         hr_parts.append(f"Avg: {summary.avg_heart_rate}")
     if hr_parts:
-        print(f"Heart Rate: {', '.join(hr_parts)} bpm")
+        out(f"Heart Rate: {', '.join(hr_parts)} bpm")
 
     # Stress
     if summary.avg_stress_level:
         stress_label = _stress_level_label(summary.avg_stress_level)
-        print(f"Stress: {summary.avg_stress_level} avg ({stress_label})", end="")
+        stress_str = f"Stress: {summary.avg_stress_level} avg ({stress_label})"
         if summary.max_stress_level:
-            print(f", {summary.max_stress_level} max")
-        else:
-            print()
+            stress_str += f", {summary.max_stress_level} max"
+        out(stress_str)
 
     # Body battery with details
     if summary.body_battery_most_recent_value:
@@ -274,7 +456,7 @@ def cmd_summary(args: argparse.Namespace) -> int:
         if summary.body_battery_net_change is not None:
             sign = "+" if summary.body_battery_net_change >= 0 else ""
             bb_parts.append(f"Net: {sign}{summary.body_battery_net_change}")
-        print(f"Body Battery: {', '.join(bb_parts)}")
+        out(f"Body Battery: {', '.join(bb_parts)}")
 
     # Intensity minutes with goal
     total_intensity = summary.total_intensity_minutes
@@ -283,14 +465,14 @@ def cmd_summary(args: argparse.Namespace) -> int:
         if summary.intensity_minutes_goal > 0
         else 0
     )
-    print(
+    out(
         f"Intensity: {summary.moderate_intensity_minutes} moderate + {summary.vigorous_intensity_minutes} vigorous "
         f"= {total_intensity} total ({intensity_pct:.0f}% of {summary.intensity_minutes_goal} goal)"
     )
 
     # Respiration
     if summary.avg_waking_respiration_value:
-        print(
+        out(
             f"Respiration: {summary.avg_waking_respiration_value:.1f} breaths/min avg"
         )
 
@@ -299,101 +481,93 @@ def cmd_summary(args: argparse.Namespace) -> int:
         spo2_str = f"SpO2: {summary.avg_spo2_value:.0f}% avg"
         if summary.lowest_spo2_value:
             spo2_str += f", {summary.lowest_spo2_value:.0f}% lowest"
-        print(spo2_str)
+        out(spo2_str)
 
     # HRV status
     if summary.hrv_status:
-        print(f"HRV Status: {summary.hrv_status}")
+        out(f"HRV Status: {summary.hrv_status}")
 
     # Activity time breakdown
-    if summary.highly_active_seconds > 0 or summary.active_seconds > 0:
-        active_mins = summary.highly_active_seconds // 60
-        light_active_mins = summary.active_seconds // 60
-        sedentary_hrs = summary.sedentary_seconds / 3600
-        print(
+    if highly_active_seconds > 0 or active_seconds > 0:
+        active_mins = highly_active_seconds // 60
+        light_active_mins = active_seconds // 60
+        out(
             f"Activity: {active_mins} min highly active, {light_active_mins} min active, "
-            f"{sedentary_hrs:.1f} hrs sedentary"
+            f"{sedentary_hours:.1f} hrs sedentary"
         )
 
     # Activities count
     if summary.activities_count > 0:
-        print(f"Recorded Activities: {summary.activities_count}")
+        out(f"Recorded Activities: {summary.activities_count}")
 
     # Sleep (if requested)
     if sleep:
-        print(f"\n--- Last Night's Sleep ---")
-        print(f"Total: {sleep.total_sleep_hours:.1f} hrs")
-        print(
+        out(f"\n--- Last Night's Sleep ---")
+        out(f"Total: {sleep.total_sleep_hours:.1f} hrs")
+        out(
             f"Stages: {sleep.deep_sleep_hours:.1f}h deep, {sleep.light_sleep_hours:.1f}h light, "
             f"{sleep.rem_sleep_hours:.1f}h REM"
         )
         if sleep.overall_score:
-            print(f"Score: {sleep.overall_score}")
+            out(f"Score: {sleep.overall_score}")
         if sleep.avg_hrv:
-            print(f"Avg HRV: {sleep.avg_hrv:.0f} ms")
+            out(f"Avg HRV: {sleep.avg_hrv:.0f} ms")
 
+    _write_lines(lines)
     return 0
 
 
+# Stress level (0-100) -> descriptive label
+_STRESS_LABELS = ("rest",) * 26 + ("low",) * 25 + ("medium",) * 25 + ("high",) * 25
+
+
 def _stress_level_label(level: int) -> str:
     """Convert stress level to descriptive label."""
-    if level <= 25:
-        return "rest"
-    elif level <= 50:
-        return "low"
-    elif level <= 75:
-        return "medium"
-    else:
-        return "high"
+    return _STRESS_LABELS[min(max(level, 0), 100)]
 
 
-def cmd_sleep(args: argparse.Namespace) -> int:
+@_with_client_and_date
+def cmd_sleep(args: argparse.Namespace, client: "GarminClient", target_date: date) -> int:
     """Handle sleep command."""
-    try:
-        client = GarminClient.from_saved_tokens()
-    except AuthenticationError:
-        print("Not logged in. Use 'garmer login' first.", file=sys.stderr)
-        return 1
-
-    # Default to yesterday to avoid timezone issues and ensure complete data
-    target_date = args.date or (date.today() - timedelta(days=1))
-    if isinstance(target_date, str):
-        target_date = datetime.strptime(target_date, "%Y-%m-%d").date()
-
     sleep = client.get_sleep(target_date)
+    lines: list[str] = []
+    out = lines.append
     if sleep:
-        print(f"\n=== Sleep Data for night ending {target_date} ===\n")
-        print(f"Total Sleep: {sleep.total_sleep_hours:.1f} hours")
-        print(
+        out(f"\n=== Sleep Data for night ending {target_date} ===\n")
+        out(f"Total Sleep: {sleep.total_sleep_hours:.1f} hours")
+        out(
             f"Deep Sleep: {sleep.deep_sleep_hours:.1f} hours ({sleep.deep_sleep_percentage:.1f}%)"
         )
-        print(f"Light Sleep: {sleep.light_sleep_hours:.1f} hours")
-        print(
+        out(f"Light Sleep: {sleep.light_sleep_hours:.1f} hours")
+        out(
             f"REM Sleep: {sleep.rem_sleep_hours:.1f} hours ({sleep.rem_sleep_percentage:.1f}%)"
         )
 
         if sleep.overall_score:
-            print(f"\nSleep Score: {sleep.overall_score}")
+            out(f"\nSleep Score: {sleep.overall_score}")
 
         if sleep.avg_sleep_heart_rate:
-            print(f"Avg HR: {sleep.avg_sleep_heart_rate} bpm")
+            out(f"Avg HR: {sleep.avg_sleep_heart_rate} bpm")
 
         if sleep.avg_hrv:
-            print(f"Avg HRV: {sleep.avg_hrv:.1f} ms")
+            out(f"Avg HRV: {sleep.avg_hrv:.1f} ms")
 
         efficiency = sleep.sleep_efficiency
         if efficiency:
-            print(f"Sleep Efficiency: {efficiency:.1f}%")
+            out(f"Sleep Efficiency: {efficiency:.1f}%")
     else:
-        print(f"No sleep data available for {target_date}")
+        out(f"No sleep data available for {target_date}")
 
+    _write_lines(lines)
     return 0
 
 
 def cmd_activities(args: argparse.Namespace) -> int:
     """Handle activities command."""
+    from garmer.auth import AuthenticationError
+
     try:
-        client = GarminClient.from_saved_tokens()
+        client = _client()
     except AuthenticationError:
         print("Not logged in. Use 'garmer login' first.", file=sys.stderr)
         return 1
@@ -401,8 +575,6 @@ def cmd_activities(args: argparse.Namespace) -> int:
     # Get activities - either for a specific date or recent
     if args.date:
         target_date = args.date
-        if isinstance(target_date, str):
-            target_date = datetime.strptime(target_date, "%Y-%m-%d").date()
         activities = client._activities.get_activities_for_date(target_date)
         title = f"Activities for {target_date}"
     else:
@@ -411,33 +583,38 @@ def cmd_activities(args: argparse.Namespace) -> int:
 
     if not activities:
         if args.json:
-            print(json.dumps({"activities": [], "count": 0}))
+            _write_json({"activities": [], "count": 0})
         else:
             print("No activities found.")
         return 0
 
     # JSON output
     if args.json:
-        data = {
-            "count": len(activities),
-            "activities": [_activity_to_dict(a) for a in activities],
-        }
-        print(json.dumps(data, indent=2, default=str))
+        sys.stdout.flush()
+        _write_json_stream(
+            sys.stdout.buffer,
+            {"count": len(activities)},
+            [("activities", (_activity_to_dict(a) for a in activities))],
+        )
+        sys.stdout.buffer.write(b"\n")
         return 0
 
     # Human-readable output
-    print(f"\n=== {title} ===\n")
+    lines = [f"\n=== {title} ===\n"]
     for activity in activities:
-        _print_activity_brief(activity)
-        print()
+        lines += _format_activity_brief(activity)
+        lines.append("")
+    _write_lines(lines)
 
     return 0
 
 
 def cmd_activity(args: argparse.Namespace) -> int:
     """Handle single activity detail command."""
+    from garmer.auth import AuthenticationError
+
     try:
-        client = GarminClient.from_saved_tokens()
+        client = _client()
     except AuthenticationError:
         print("Not logged in. Use 'garmer login' first.", file=sys.stderr)
         return 1
@@ -471,14 +648,64 @@ def cmd_activity(args: argparse.Namespace) -> int:
             data["laps"] = [_lap_to_dict(lap) for lap in laps]
         if hr_zones:
             data["hr_zones"] = hr_zones
-        print(json.dumps(data, indent=2, default=str))
+        _write_json(data, indent=True)
         return 0
 
     # Human-readable output
-    _print_activity_detailed(activity, laps, hr_zones)
+    _write_lines(_format_activity_detailed(activity, laps, hr_zones))
     return 0
 
 
+def _activity_pace(activity) -> float | None:
+    """Get an activity's rounded pace in min/km, or None without one."""
+    pace = activity.pace_per_km
+    return round(pace, 2) if pace else None
+
+
+# Optional entries of an activity's JSON output, in output order:
+# (key, sub-keys, getter, how many leading values to check, always in detailed).
+# A section with sub-keys is included when any of the checked values is set;
+# a plain entry (no sub-keys) when its getter returns a value other than None.
+_ACTIVITY_SECTIONS = (
+    (
+        "elevation",
+        ("gain", "loss", "min", "max"),
+        attrgetter("elevation_gain", "elevation_loss", "min_elevation", "max_elevation"),
+        1,
+        True,
+    ),
+    ("pace_min_per_km", None, _activity_pace, 0, False),
+    (
+        "training_effect",
+        ("aerobic", "anaerobic", "label"),
+        attrgetter(
+            "aerobic_training_effect", "anaerobic_training_effect", "training_effect_label"
+        ),
+        2,
+        False,
+    ),
+    ("cadence", ("avg", "max"), attrgetter("avg_cadence", "max_cadence"), 1, False),
+    (
+        "power",
+        ("avg", "max", "normalized"),
+        attrgetter("avg_power", "max_power", "normalized_power"),
+        1,
+        False,
+    ),
+    ("steps", None, lambda activity: activity.steps or None, 0, False),
+    (
+        "swimming",
+        ("total_strokes", "avg_strokes", "pool_length", "avg_swolf"),
+        attrgetter("total_strokes", "avg_stroke_count", "pool_length", "avg_swolf"),
+        1,
+        False,
+    ),
+)
+_get_zone_fields = itemgetter("zoneNumber", "secsInZone")
+_HEART_RATE_KEYS = ("avg", "max", "min")
+_get_heart_rate = attrgetter("avg_heart_rate", "max_heart_rate", "min_heart_rate")
+
+
 def _activity_to_dict(activity, detailed: bool = False) -> dict:
     """Convert activity to dictionary for JSON output."""
     data = {
@@ -491,55 +718,16 @@ def _activity_to_dict(activity, detailed: bool = False) -> dict:
             round(activity.distance_km, 2) if activity.distance_meters > 0 else None
         ),
         "calories": int(activity.calories),
-        "heart_rate": {
-            "avg": activity.avg_heart_rate,
-            "max": activity.max_heart_rate,
-            "min": activity.min_heart_rate,
-        },
+        "heart_rate": dict(zip(_HEART_RATE_KEYS, _get_heart_rate(activity))),
     }
 
-    if detailed or activity.elevation_gain:
-        data["elevation"] = {
-            "gain": activity.elevation_gain,
-            "loss": activity.elevation_loss,
-            "min": activity.min_elevation,
-            "max": activity.max_elevation,
-        }
-
-    if activity.pace_per_km:
-        data["pace_min_per_km"] = round(activity.pace_per_km, 2)
-
-    if activity.aerobic_training_effect or activity.anaerobic_training_effect:
-        data["training_effect"] = {
-            "aerobic": activity.aerobic_training_effect,
-            "anaerobic": activity.anaerobic_training_effect,
-            "label": activity.training_effect_label,
-        }
-
-    if activity.avg_cadence:
-        data["cadence"] = {
-            "avg": activity.avg_cadence,
-            "max": activity.max_cadence,
-        }
-
-    if activity.avg_power:
-        data["power"] = {
-            "avg": activity.avg_power,
-            "max": activity.max_power,
-            "normalized": activity.normalized_power,
-        }
-
-    if activity.steps:
-        data["steps"] = activity.steps
-
-    # Swimming metrics
-    if activity.total_strokes:
-        data["swimming"] = {
-            "total_strokes": activity.total_strokes,
-            "avg_strokes": activity.avg_stroke_count,
-            "pool_length": activity.pool_length,
-            "avg_swolf": activity.avg_swolf,
-        }
+    for key, fields, get_values, checked, in_detailed in _ACTIVITY_SECTIONS:
+        values = get_values(activity)
+        if fields is None:
+            if values is not None:
+                data[key] = values
+        elif (detailed and in_detailed) or any(values[:checked]):
+            data[key] = dict(zip(fields, values))
 
     return data
 
@@ -558,225 +746,213 @@ def _lap_to_dict(lap) -> dict:
     }
 
 
-def _print_activity_brief(activity) -> None:
-    """Print brief activity summary."""
-    print(f"[{activity.activity_type_key}] {activity.activity_name}")
-    print(f"  Date: {activity.start_time}")
-    print(f"  Duration: {activity.duration_minutes:.1f} min")
+def _format_activity_brief(activity) -> list[str]:
+    """Format a brief activity summary as output lines."""
+    lines: list[str] = []
+    out = lines.append
+    out(f"[{activity.activity_type_key}] {activity.activity_name}")
+    out(f"  Date: {activity.start_time}")
+    out(f"  Duration: {activity.duration_minutes:.1f} min")
     if activity.distance_meters > 0:
-        print(f"  Distance: {activity.distance_km:.2f} km", end="")
+        distance_str = f"  Distance: {activity.distance_km:.2f} km"
         if activity.pace_per_km:
             pace_min = int(activity.pace_per_km)
             pace_sec = int((activity.pace_per_km - pace_min) * 60)
-            print(f" ({pace_min}:{pace_sec:02d}/km)")
-        else:
-            print()
-    print(f"  Calories: {activity.calories:.0f}")
+            distance_str += f" ({pace_min}:{pace_sec:02d}/km)"
+        out(distance_str)
+    out(f"  Calories: {activity.calories:.0f}")
     if activity.avg_heart_rate:
         hr_str = f"  HR: {activity.avg_heart_rate} avg"
         if activity.max_heart_rate:
             hr_str += f", {activity.max_heart_rate} max"
-        print(hr_str)
+        out(hr_str)
     if activity.aerobic_training_effect:
-        print(
-            f"  Training Effect: {activity.aerobic_training_effect:.1f} aerobic", end=""
-        )
+        te_str = f"  Training Effect: {activity.aerobic_training_effect:.1f} aerobic"
         if activity.anaerobic_training_effect:
-            print(f", {activity.anaerobic_training_effect:.1f} anaerobic")
-        else:
-            print()
+            te_str += f", {activity.anaerobic_training_effect:.1f} anaerobic"
+        out(te_str)
+
+    return lines
 
 
-def _print_activity_detailed(activity, laps: list, hr_zones: dict | None) -> None:
-    """Print detailed activity information."""
-    print(f"\n=== {activity.activity_name} ===")
-    print(f"Type: {activity.activity_type_key}")
-    print(f"Date: {activity.start_time}")
-    print(f"ID: {activity.activity_id}")
+def _format_activity_detailed(activity, laps: list, hr_zones: dict | None) -> list[str]:
+    """Format detailed activity information as output lines."""
+    lines: list[str] = []
+    out = lines.append
+    out(f"\n=== {activity.activity_name} ===")
+    out(f"Type: {activity.activity_type_key}")
+    out(f"Date: {activity.start_time}")
+    out(f"ID: {activity.activity_id}")
 
-    print(f"\n--- Performance ---")
+    out(f"\n--- Performance ---")
     # Duration
     duration_mins = activity.duration_minutes
     if duration_mins >= 60:
         hours = int(duration_mins // 60)
         mins = int(duration_mins % 60)
-        print(f"Duration: {hours}h {mins}m")
+        out(f"Duration: {hours}h {mins}m")
     else:
-        print(f"Duration: {duration_mins:.1f} min")
+        out(f"Duration: {duration_mins:.1f} min")
 
     # Distance and pace
     if activity.distance_meters > 0:
-        print(
+        out(
             f"Distance: {activity.distance_km:.2f} km ({activity.distance_miles:.2f} mi)"
         )
         if activity.pace_per_km:
             pace_min = int(activity.pace_per_km)
             pace_sec = int((activity.pace_per_km - pace_min) * 60)
-            print(f"Pace: {pace_min}:{pace_sec:02d}/km")
+            out(f"Pace: {pace_min}:{pace_sec:02d}/km")
 
     # Speed
     if activity.avg_speed:
         avg_speed_kmh = activity.avg_speed * 3.6  # m/s to km/h
-        print(f"Speed: {avg_speed_kmh:.1f} km/h avg", end="")
+        speed_str = f"Speed: {avg_speed_kmh:.1f} km/h avg"
         if activity.max_speed:
             max_speed_kmh = activity.max_speed * 3.6
-            print(f", {max_speed_kmh:.1f} km/h max")
-        else:
-            print()
+            speed_str += f", {max_speed_kmh:.1f} km/h max"
+        out(speed_str)
 
-    print(f"Calories: {activity.calories:.0f} ({activity.active_calories:.0f} active)")
+    out(f"Calories: {activity.calories:.0f} ({activity.active_calories:.0f} active)")
 
     # Heart rate
     if activity.avg_heart_rate:
-        print(f"\n--- Heart Rate ---")
-        print(f"Average: {activity.avg_heart_rate} bpm")
+        out(f"\n--- Heart Rate ---")
+        out(f"Average: {activity.avg_heart_rate} bpm")
         if activity.max_heart_rate:
-            print(f"Max: {activity.max_heart_rate} bpm")
+            out(f"Max: {activity.max_heart_rate} bpm")
         if activity.min_heart_rate:
-            print(f"Min: {activity.min_heart_rate} bpm")
+            out(f"Min: {activity.min_heart_rate} bpm")
 
     # Elevation
     if activity.elevation_gain:
-        print(f"\n--- Elevation ---")
-        print(f"Gain: {activity.elevation_gain:.0f} m")
+        out(f"\n--- Elevation ---")
+        out(f"Gain: {activity.elevation_gain:.0f} m")
         if activity.elevation_loss:
-            print(f"Loss: {activity.elevation_loss:.0f} m")
+            out(f"Loss: {activity.elevation_loss:.0f} m")
         if activity.min_elevation and activity.max_elevation:
-            print(
+            out(
                 f"Range: {activity.min_elevation:.0f} - {activity.max_elevation:.0f} m"
             )
 
     # Training effect
     if activity.aerobic_training_effect:
-        print(f"\n--- Training Effect ---")
-        print(f"Aerobic: {activity.aerobic_training_effect:.1f}")
+        out(f"\n--- Training Effect ---")
+        out(f"Aerobic: {activity.aerobic_training_effect:.1f}")
         if activity.anaerobic_training_effect:
-            print(f"Anaerobic: {activity.anaerobic_training_effect:.1f}")
+            out(f"Anaerobic: {activity.anaerobic_training_effect:.1f}")
         if activity.training_effect_label:
-            print(f"Label: {activity.training_effect_label}")
+            out(f"Label: {activity.training_effect_label}")
 
     # Cadence
     if activity.avg_cadence:
-        print(f"\n--- Cadence ---")
-        print(f"Average: {activity.avg_cadence:.0f} spm")
+        out(f"\n--- Cadence ---")
+        out(f"Average: {activity.avg_cadence:.0f} spm")
         if activity.max_cadence:
-            print(f"Max: {activity.max_cadence:.0f} spm")
+            out(f"Max: {activity.max_cadence:.0f} spm")
 
     # Power
     if activity.avg_power:
-        print(f"\n--- Power ---")
-        print(f"Average: {activity.avg_power:.0f} W")
+        out(f"\n--- Power ---")
+        out(f"Average: {activity.avg_power:.0f} W")
         if activity.max_power:
-            print(f"Max: {activity.max_power:.0f} W")
+            out(f"Max: {activity.max_power:.0f} W")
         if activity.normalized_power:
-            print(f"Normalized: {activity.normalized_power:.0f} W")
+            out(f"Normalized: {activity.normalized_power:.0f} W")
 
     # Steps
     if activity.steps:
-        print(f"\nSteps: {activity.steps:,}")
+        out(f"\nSteps: {activity.steps:,}")
 
     # Swimming
     if activity.total_strokes:
-        print(f"\n--- Swimming ---")
-        print(f"Total Strokes: {activity.total_strokes}")
+        out(f"\n--- Swimming ---")
+        out(f"Total Strokes: {activity.total_strokes}")
         if activity.avg_stroke_count:
-            print(f"Avg Strokes/Length: {activity.avg_stroke_count:.1f}")
+            out(f"Avg Strokes/Length: {activity.avg_stroke_count:.1f}")
         if activity.avg_swolf:
-            print(f"Avg SWOLF: {activity.avg_swolf:.0f}")
+            out(f"Avg SWOLF: {activity.avg_swolf:.0f}")
         if activity.pool_length:
-            print(f"Pool Length: {activity.pool_length:.0f} m")
+            out(f"Pool Length: {activity.pool_length:.0f} m")
 
     # HR Zones
     if hr_zones:
-        print(f"\n--- HR Zones ---")
+        out(f"\n--- HR Zones ---")
         if isinstance(hr_zones, list):
             for zone in hr_zones:
-                zone_num = zone.get("zoneNumber", "?")
-                seconds = zone.get("secsInZone", 0)
+                try:
+                    zone_num, seconds = _get_zone_fields(zone)
+                except KeyError:
+                    zone_num, seconds = zone.get("zoneNumber", "?"), zone.get("secsInZone", 0)
                 mins = seconds // 60
-                print(f"Zone {zone_num}: {mins} min")
+                out(f"Zone {zone_num}: {mins} min")
 
     # Laps
     if laps:
-        print(f"\n--- Laps ({len(laps)}) ---")
+        out(f"\n--- Laps ({len(laps)}) ---")
         for lap in laps:
             lap_dist = lap.distance_meters / 1000 if lap.distance_meters else 0
             lap_dur = lap.duration_seconds / 60 if lap.duration_seconds else 0
-            print(
-                f"Lap {lap.lap_number + 1}: {lap_dist:.2f} km in {lap_dur:.1f} min",
-                end="",
-            )
+            lap_str = f"Lap {lap.lap_number + 1}: {lap_dist:.2f} km in {lap_dur:.1f} min"
             if lap.avg_heart_rate:
-                print(f" @ {lap.avg_heart_rate} bpm")
-            else:
-                print()
-
+                lap_str += f" @ {lap.avg_heart_rate} bpm"
+            out(lap_str)
 
-def cmd_snapshot(args: argparse.Namespace) -> int:
-    """Handle health snapshot command."""
-    try:
-        client = GarminClient.from_saved_tokens()
-    except AuthenticationError:
-        print("Not logged in. Use 'garmer login' first.", file=sys.stderr)
-        return 1
+    return lines
 
-    # Default to yesterday to avoid timezone issues and ensure complete data
-    target_date = args.date or (date.today() - timedelta(days=1))
-    if isinstance(target_date, str):
-        target_date = datetime.strptime(target_date, "%Y-%m-%d").date()
 
+@_with_client_and_date
+def cmd_snapshot(args: argparse.Namespace, client: "GarminClient", target_date: date) -> int:
+    """Handle health snapshot command."""
     snapshot = client.get_health_snapshot(target_date)
 
     if args.json:
-        print(json.dumps(snapshot, indent=2, default=str))
+        _write_json(snapshot, indent=True)
     else:
-        print(f"\n=== Health Snapshot for {target_date} ===\n")
+        lines = [f"\n=== Health Snapshot for {target_date} ===\n"]
+        out = lines.append
 
         if snapshot.get("steps"):
             steps = snapshot["steps"]
-            print(f"Steps: {steps['total']:,} / {steps['goal']:,}")
+            out(f"Steps: {steps['total']:,} / {steps['goal']:,}")
 
         if snapshot.get("sleep"):
             sleep = snapshot["sleep"]
-            print(f"Sleep Score: {sleep.get('overall_score', 'N/A')}")
+            out(f"Sleep Score: {sleep.get('overall_score', 'N/A')}")
 
         if snapshot.get("heart_rate"):
             hr = snapshot["heart_rate"]
-            print(f"Resting HR: {hr.get('resting', 'N/A')} bpm")
+            out(f"Resting HR: {hr.get('resting', 'N/A')} bpm")
 
         if snapshot.get("stress"):
             stress = snapshot["stress"]
-            print(f"Avg Stress: {stress.get('avg_level', 'N/A')}")
+            out(f"Avg Stress: {stress.get('avg_level', 'N/A')}")
 
         if snapshot.get("hydration"):
             hydration = snapshot["hydration"]
-            print(f"Hydration: {hydration.get('goal_percentage', 0):.0f}% of goal")
+            out(f"Hydration: {hydration.get('goal_percentage', 0):.0f}% of goal")
+
+        _write_lines(lines)
 
     return 0
 
 
 def cmd_export(args: argparse.Namespace) -> int:
     """Handle export command."""
+    from garmer.auth import AuthenticationError
+
     try:
-        client = GarminClient.from_saved_tokens()
+        client = _client()
     except AuthenticationError:
         print("Not logged in. Use 'garmer login' first.", file=sys.stderr)
         return 1
 
     end_date = args.end_date or date.today()
-    if isinstance(end_date, str):
-        end_date = datetime.strptime(end_date, "%Y-%m-%d").date()
-
-    start_date = args.start_date
-    if start_date:
-        if isinstance(start_date, str):
-            start_date = datetime.strptime(start_date, "%Y-%m-%d").date()
-    else:
-        start_date = end_date - timedelta(days=args.days - 1)
+    start_date = args.start_date or end_date - timedelta(days=args.days - 1)
 
     print(f"Exporting data from {start_date} to {end_date}...")
 
-    data = client.export_data(
+    datasets = client.iter_export_data(
         start_date=start_date,
         end_date=end_date,
         include_activities=True,
@@ -784,21 +960,71 @@ def cmd_export(args: argparse.Namespace) -> int:
         include_daily=True,
     )
 
-    output_path = (
-        Path(args.output)
-        if args.output
-        else Path(f"garmin_export_{start_date}_{end_date}.json")
-    )
+    extension = "ndjson" if args.ndjson else "json"
+    output_path = args.output or f"garmin_export_{start_date}_{end_date}.{extension}"
 
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    with open(output_path, "wb") as f:
+        period = {"start": str(start_date), "end": str(end_date)}
+        if args.ndjson:
+            _write_ndjson(f, [("period", [period]), *datasets])
+        else:
+            _write_json_stream(f, {"period": period}, datasets)
 
     print(f"Exported data to {output_path}")
     return 0
 
 
+def _write_ndjson(f: BinaryIO, datasets: Iterable[tuple[str, Iterable[Any]]]) -> None:
+    """
+    Write records as newline-delimited JSON.
+
+    Each line is a compact {"dataset": ..., "data": ...} object, so consumers
+    can process an export record by record.
+    """
+    from garmer import _json
+
+    for key, records in datasets:
+        for record in records:
+            f.write(_json.dumpb({"dataset": key, "data": record}) + b"\n")
+
+
+def _indent_json(data: bytes, level: int) -> bytes:
+    """Indent an encoded JSON value for nesting at the given depth."""
+    return data.replace(b"\n", b"\n" + b"  " * level)
+
+
+def _write_json_stream(
+    f: BinaryIO, fields: dict, arrays: Iterable[tuple[str, Iterable[Any]]]
+) -> None:
+    """
+    Write a JSON object as indented JSON, one array item at a time.
+
+    The plain fields are written first, followed by each (key, items) array.
+    The result is the same document as encoding the whole object at once,
+    but only one array item is converted and encoded at any moment.
+    """
+    from garmer import _json
+
+    separator = b"{\n  "
+    for key, value in fields.items():
+        encoded = _indent_json(_json.dumpb(value, indent=True), 1)
+        f.write(separator + _json.dumpb(key) + b": " + encoded)
+        separator = b",\n  "
+    for key, items in arrays:
+        f.write(separator + _json.dumpb(key) + b": [")
+        item_separator = b"\n    "
+        for item in items:
+            f.write(item_separator + _indent_json(_json.dumpb(item, indent=True), 2))
+            item_separator = b",\n    "
+        f.write(b"]" if item_separator == b"\n    " else b"\n  ]")
+        separator = b",\n  "
+    f.write(b"{}" if separator == b"{\n  " else b"\n}")
+
+
 def cmd_update(args: argparse.Namespace) -> int:
     """Handle update command - pull latest changes from git."""
+    import subprocess
+
     package_root = _get_package_root()
 
     if not package_root:
@@ -809,47 +1035,34 @@ def cmd_update(args: argparse.Namespace) -> int:
     print(f"Updating garmer from {package_root}...")
 
     try:
-        # Fetch first to see what's available
-        subprocess.run(
-            ["git", "fetch"],
-            cwd=package_root,
-            check=True,
-            capture_output=True,
-        )
-
-        # Check if there are updates
-        result = subprocess.run(
-            ["git", "status", "-uno"],
+        # A single pull both fetches and fast-forwards. The C locale keeps its
+        # messages stable enough to tell whether anything came in.
+        pull_result = subprocess.run(
+            ["git", "-c", "color.ui=never", "pull", "--ff-only", "--stat"],
             cwd=package_root,
             check=True,
             capture_output=True,
             text=True,
+            env={**os.environ, "LC_ALL": "C"},
         )
 
-        if "Your branch is up to date" in result.stdout:
+        # "up-to-date" is the spelling used by git < 2.16
+        if "up to date" in pull_result.stdout or "up-to-date" in pull_result.stdout:
             print("Already up to date.")
             return 0
 
-        # Show what will change
+        # Show what came in (ORIG_HEAD is where HEAD was before the pull)
         log_result = subprocess.run(
-            ["git", "log", "--oneline", "HEAD..@{u}"],
+            ["git", "log", "--oneline", "ORIG_HEAD..HEAD"],
             cwd=package_root,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
         )
         if log_result.stdout.strip():
             print("\nIncoming changes:")
             print(log_result.stdout)
 
-        # Pull the changes
-        pull_result = subprocess.run(
-            ["git", "pull", "--ff-only"],
-            cwd=package_root,
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-
         print(pull_result.stdout)
         print(
             "Update complete! Changes will take effect immediately (editable install)."
@@ -864,6 +1077,35 @@ def cmd_update(args: argparse.Namespace) -> int:
         return 1
 
 
+def _read_git_head(package_root: str) -> str | None:
+    """
+    Read the commit checked out in a repository without running git.
+
+    Returns None when the files alone are not enough (e.g. in a worktree,
+    where .git is a file), so the caller can fall back to git itself.
+    """
+    git_dir = os.path.join(package_root, ".git")
+    try:
+        with open(os.path.join(git_dir, "HEAD")) as f:
+            head = f.read().strip()
+        if not head.startswith("ref: "):
+            return head  # detached HEAD
+        ref = head[5:]
+        try:
+            with open(os.path.join(git_dir, ref)) as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            # The ref has been packed
+            with open(os.path.join(git_dir, "packed-refs")) as f:
+                for line in f:
+                    sha, _, name = line.rstrip("\n").partition(" ")
+                    if name == ref:
+                        return sha
+    except OSError:
+        pass
+    return None
+
+
 def cmd_version(args: argparse.Namespace) -> int:
     """Handle version command."""
     from garmer import __version__
@@ -871,24 +1113,39 @@ def cmd_version(args: argparse.Namespace) -> int:
     print(f"garmer {__version__}")
 
     package_root = _get_package_root()
-    if package_root:
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--short", "HEAD"],
-                cwd=package_root,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                print(f"git: {result.stdout.strip()}")
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
+    if not package_root:
+        return 0
+
+    sha = _read_git_head(package_root)
+    if sha:
+        print(f"git: {sha[:7]}")
+        return 0
+
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=package_root,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode == 0:
+            print(f"git: {result.stdout.strip()}")
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        pass
 
     return 0
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser."""
+def create_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """
+    Create the argument parser.
+
+    Args:
+        command: Only register this subcommand, to save building the others
+            when the command is already known. All are registered if None.
+    """
     parser = argparse.ArgumentParser(
         prog="garmer",
         description="Garmin data extraction tool for MoltBot integration",
@@ -899,118 +1156,248 @@ def create_parser() -> argparse.ArgumentParser:
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
+    def wanted(name: str) -> bool:
+        return command is None or command == name
+
     # Login command
-    login_parser = subparsers.add_parser("login", help="Login to Garmin Connect")
-    login_parser.add_argument("-e", "--email", help="Garmin Connect email")
-    login_parser.add_argument("-p", "--password", help="Garmin Connect password")
+    if wanted("login"):
+        login_parser = subparsers.add_parser("login", help="Login to Garmin Connect")
+        login_parser.add_argument("-e", "--email", help="Garmin Connect email")
+        login_parser.add_argument("-p", "--password", help="Garmin Connect password")
 
     # Logout command
-    subparsers.add_parser("logout", help="Logout and delete saved tokens")
+    if wanted("logout"):
+        subparsers.add_parser("logout", help="Logout and delete saved tokens")
 
     # Status command
-    subparsers.add_parser("status", help="Show authentication status")
+    if wanted("status"):
+        subparsers.add_parser("status", help="Show authentication status")
 
     # Summary command
-    summary_parser = subparsers.add_parser("summary", help="Show daily summary")
-    summary_parser.add_argument(
-        "-d", "--date", help="Date (YYYY-MM-DD), defaults to yesterday"
-    )
-    summary_parser.add_argument(
-        "--json", action="store_true", help="Output as JSON (for scripts/AI agents)"
-    )
-    summary_parser.add_argument(
-        "-s",
-        "--with-sleep",
-        action="store_true",
-        help="Include last night's sleep data",
-    )
+    if wanted("summary"):
+        summary_parser = subparsers.add_parser("summary", help="Show daily summary")
+        summary_parser.add_argument(
+            "-d", "--date", type=_parse_date, help="Date (YYYY-MM-DD), defaults to yesterday"
+        )
+        summary_parser.add_argument(
+            "--json", action="store_true", help="Output as JSON (for scripts/AI agents)"
+        )
+        summary_parser.add_argument(
+            "-s",
+            "--with-sleep",
+            action="store_true",
+            help="Include last night's sleep data",
+        )
 
     # Sleep command
-    sleep_parser = subparsers.add_parser("sleep", help="Show sleep data")
-    sleep_parser.add_argument(
-        "-d", "--date", help="Date (YYYY-MM-DD), defaults to yesterday"
-    )
+    if wanted("sleep"):
+        sleep_parser = subparsers.add_parser("sleep", help="Show sleep data")
+        sleep_parser.add_argument(
+            "-d", "--date", type=_parse_date, help="Date (YYYY-MM-DD), defaults to yesterday"
+        )
 
     # Activities command (list)
-    activities_parser = subparsers.add_parser(
-        "activities", help="List recent activities"
-    )
-    activities_parser.add_argument(
-        "-n", "--limit", type=int, default=10, help="Number of activities"
-    )
-    activities_parser.add_argument(
-        "-d", "--date", help="Get activities for specific date (YYYY-MM-DD)"
-    )
-    activities_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    if wanted("activities"):
+        activities_parser = subparsers.add_parser(
+            "activities", help="List recent activities"
+        )
+        activities_parser.add_argument(
+            "-n", "--limit", type=int, default=10, help="Number of activities"
+        )
+        activities_parser.add_argument(
+            "-d",
+            "--date",
+            type=_parse_date,
+            help="Get activities for specific date (YYYY-MM-DD)",
+        )
+        activities_parser.add_argument("--json", action="store_true", help="Output as JSON")
 
     # Activity command (single activity detail)
-    activity_parser = subparsers.add_parser(
-        "activity", help="Show detailed activity info"
-    )
-    activity_parser.add_argument(
-        "id", type=int, nargs="?", help="Activity ID (omit for latest)"
-    )
-    activity_parser.add_argument("--laps", action="store_true", help="Include lap data")
-    activity_parser.add_argument(
-        "--zones", action="store_true", help="Include HR zone data"
-    )
-    activity_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    if wanted("activity"):
+        activity_parser = subparsers.add_parser(
+            "activity", help="Show detailed activity info"
+        )
+        activity_parser.add_argument(
+            "id", type=int, nargs="?", help="Activity ID (omit for latest)"
+        )
+        activity_parser.add_argument("--laps", action="store_true", help="Include lap data")
+        activity_parser.add_argument(
+            "--zones", action="store_true", help="Include HR zone data"
+        )
+        activity_parser.add_argument("--json", action="store_true", help="Output as JSON")
 
     # Snapshot command
-    snapshot_parser = subparsers.add_parser("snapshot", help="Get health snapshot")
-    snapshot_parser.add_argument(
-        "-d", "--date", help="Date (YYYY-MM-DD), defaults to yesterday"
-    )
-    snapshot_parser.add_argument("--json", action="store_true", help="Output as JSON")
+    if wanted("snapshot"):
+        snapshot_parser = subparsers.add_parser("snapshot", help="Get health snapshot")
+        snapshot_parser.add_argument(
+            "-d", "--date", type=_parse_date, help="Date (YYYY-MM-DD), defaults to yesterday"
+        )
+        snapshot_parser.add_argument("--json", action="store_true", help="Output as JSON")
 
     # Export command
-    export_parser = subparsers.add_parser("export", help="Export data to file")
-    export_parser.add_argument("-s", "--start-date", help="Start date (YYYY-MM-DD)")
-    export_parser.add_argument("-e", "--end-date", help="End date (YYYY-MM-DD)")
-    export_parser.add_argument(
-        "-n", "--days", type=int, default=7, help="Number of days (if no start date)"
-    )
-    export_parser.add_argument("-o", "--output", help="Output file path")
+    if wanted("export"):
+        export_parser = subparsers.add_parser("export", help="Export data to file")
+        export_parser.add_argument(
+            "-s", "--start-date", type=_parse_date, help="Start date (YYYY-MM-DD)"
+        )
+        export_parser.add_argument(
+            "-e", "--end-date", type=_parse_date, help="End date (YYYY-MM-DD)"
+        )
+        export_parser.add_argument(
+            "-n", "--days", type=int, default=7, help="Number of days (if no start date)"
+        )
+        export_parser.add_argument("-o", "--output", help="Output file path")
+        export_parser.add_argument(
+            "--ndjson",
+            action="store_true",
+            help="Write one JSON record per line instead of a single document",
+        )
 
     # Update command
-    subparsers.add_parser("update", help="Update garmer to latest version (git pull)")
+    if wanted("update"):
+        subparsers.add_parser(
+            "update",
+            help="Update garmer to latest version (git pull)",
+            description="Update garmer to latest version (git pull). If the source "
+            "checkout is not found automatically, set GARMER_ROOT to its path.",
+        )
 
     # Version command
-    subparsers.add_parser("version", help="Show version information")
+    if wanted("version"):
+        subparsers.add_parser("version", help="Show version information")
 
     return parser
 
 
+# Options understood by _parse_fast(): command -> {flag: (dest, type)}, where a
+# type of None marks a store_true flag. Keep in sync with create_parser().
+_DATE_OPTION = ("date", _parse_date)
+_JSON_OPTION = ("json", None)
+_FAST_OPTIONS: dict[str, dict[str, tuple[str, Callable[[str], Any] | None]]] = {
+    "login": {
+        "-e": ("email", str),
+        "--email": ("email", str),
+        "-p": ("password", str),
+        "--password": ("password", str),
+    },
+    "logout": {},
+    "status": {},
+    "summary": {
+        "-d": _DATE_OPTION,
+        "--date": _DATE_OPTION,
+        "--json": _JSON_OPTION,
+        "-s": ("with_sleep", None),
+        "--with-sleep": ("with_sleep", None),
+    },
+    "sleep": {"-d": _DATE_OPTION, "--date": _DATE_OPTION},
+    "activities": {
+        "-n": ("limit", int),
+        "--limit": ("limit", int),
+        "-d": _DATE_OPTION,
+        "--date": _DATE_OPTION,
+        "--json": _JSON_OPTION,
+    },
+    "activity": {
+        "--laps": ("laps", None),
+        "--zones": ("zones", None),
+        "--json": _JSON_OPTION,
+    },
+    "snapshot": {"-d": _DATE_OPTION, "--date": _DATE_OPTION, "--json": _JSON_OPTION},
+    "export": {
+        "-s": ("start_date", _parse_date),
+        "--start-date": ("start_date", _parse_date),
+        "-e": ("end_date", _parse_date),
+        "--end-date": ("end_date", _parse_date),
+        "-n": ("days", int),
+        "--days": ("days", int),
+        "-o": ("output", str),
+        "--output": ("output", str),
+        "--ndjson": ("ndjson", None),
+    },
+    "update": {},
+    "version": {},
+}
+_FAST_POSITIONALS: dict[str, tuple[str, type]] = {"activity": ("id", int)}
+_FAST_DEFAULTS = {"limit": 10, "days": 7}
+
+
+def _parse_fast(argv: list[str]) -> argparse.Namespace | None:
+    """
+    Parse a plain command line without building the argparse parser.
+
+    Handles the common forms: an optional -v, a known command and its
+    options. Returns None for anything else, including help requests and
+    invalid values, so that argparse can produce its usual output and errors.
+    """
+    verbose = bool(argv) and argv[0] in ("-v", "--verbose")
+    if verbose:
+        argv = argv[1:]
+    if not argv or argv[0] not in _FAST_OPTIONS:
+        return None
+
+    command = argv[0]
+    options = _FAST_OPTIONS[command]
+    positional = _FAST_POSITIONALS.get(command)
+    values: dict[str, Any] = {
+        dest: _FAST_DEFAULTS.get(dest) if type_ else False
+        for dest, type_ in options.values()
+    }
+    if positional:
+        values[positional[0]] = None
+
+    args = iter(argv[1:])
+    try:
+        for arg in args:
+            if arg in options:
+                dest, type_ = options[arg]
+                values[dest] = type_(next(args)) if type_ else True
+            elif positional and not arg.startswith("-") and values[positional[0]] is None:
+                values[positional[0]] = positional[1](arg)
+            else:
+                return None
+    except (StopIteration, ValueError, argparse.ArgumentTypeError):
+        return None
+
+    return argparse.Namespace(verbose=verbose, command=command, **values)
+
+
+_COMMANDS: dict[str, Callable[[argparse.Namespace], int]] = {
+    "login": cmd_login,
+    "logout": cmd_logout,
+    "status": cmd_status,
+    "summary": cmd_summary,
+    "sleep": cmd_sleep,
+    "activities": cmd_activities,
+    "activity": cmd_activity,
+    "snapshot": cmd_snapshot,
+    "export": cmd_export,
+    "update": cmd_update,
+    "version": cmd_version,
+}
+
+
 def main() -> int:
     """Main entry point for CLI."""
-    parser = create_parser()
-    args = parser.parse_args()
+    # argparse is only needed for help, errors and unusual option forms, and
+    # then only the named command's parser is built
+    argv = sys.argv[1:]
+    args = _parse_fast(argv)
+    if args is None:
+        command = next((arg for arg in argv if not arg.startswith("-")), None)
+        parser = create_parser(command if command in _FAST_OPTIONS else None)
+        args = parser.parse_args(argv)
 
     setup_logging(args.verbose)
 
     if args.command is None:
-        parser.print_help()
+        create_parser().print_help()
         return 0
 
-    commands = {
-        "login": cmd_login,
-        "logout": cmd_logout,
-        "status": cmd_status,
-        "summary": cmd_summary,
-        "sleep": cmd_sleep,
-        "activities": cmd_activities,
-        "activity": cmd_activity,
-        "snapshot": cmd_snapshot,
-        "export": cmd_export,
-        "update": cmd_update,
-        "version": cmd_version,
-    }
-
-    handler = commands.get(args.command)
+    handler = _COMMANDS.get(args.command)
     if handler:
         return handler(args)
     else:
-        parser.print_help()
+        create_parser().print_help()
         return 1
 
 
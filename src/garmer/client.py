@@ -5,22 +5,19 @@ This module provides the primary interface for extracting health and fitness
 data from Garmin Connect.
 """
 
+import asyncio
+import functools
 import logging
+from collections.abc import Callable, Coroutine, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from garmer.auth import GarminAuth, create_auth
-from garmer.extractors import (
-    ActivityExtractor,
-    BodyExtractor,
-    DailyExtractor,
-    HeartRateExtractor,
-    SleepExtractor,
-    StepsExtractor,
-    StressExtractor,
-    UserExtractor,
-)
+from garmer.cache import RequestCoalescer, SQLiteCache, TTLCache
+from garmer.extractors.base import BaseExtractor
 from garmer.models import (
     Activity,
     BodyComposition,
@@ -35,8 +32,205 @@ from garmer.models import (
     Weight,
 )
 
+if TYPE_CHECKING:
+    from garmer.extractors import (
+        ActivityExtractor,
+        BodyExtractor,
+        DailyExtractor,
+        HeartRateExtractor,
+        SleepExtractor,
+        StepsExtractor,
+        StressExtractor,
+        UserExtractor,
+    )
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Cache lifetimes (seconds) for endpoint results
+DEFAULT_CACHE_TTL = 60
+REALTIME_CACHE_TTL = 5
+STATIC_CACHE_TTL = 300
+# Data for days before yesterday no longer changes (yesterday's can still be
+# completed by a late device sync)
+HISTORICAL_CACHE_TTL = 24 * 60 * 60
+
+# Offset from the last to the first day of a seven-day period
+_WEEK_DELTA = timedelta(days=6)
+
+_MISSING = object()
+
+
+def _ttl_cached(ttl: float, dated: bool = False) -> Callable[[F], F]:
+    """
+    Cache a GarminClient method's result in the client's TTL cache.
+
+    Results are keyed by method name and call arguments. None results are
+    not cached so that transient failures are retried on the next call.
+
+    Args:
+        ttl: Time-to-live in seconds for cached results
+        dated: The method's first argument (target_date) is the date the data
+               is for. It is keyed by its ISO string, so a date, datetime,
+               string or None (today) for the same day share one entry, and
+               results for dates before yesterday are kept for
+               HISTORICAL_CACHE_TTL instead
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(self: "GarminClient", *args: Any, **kwargs: Any) -> Any:
+            if self._cache is None:
+                return func(self, *args, **kwargs)
+
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            target = None
+            if dated:
+                try:
+                    target, iso_date = _norm_date(
+                        args[0] if args else kwargs.get("target_date")
+                    )
+                except ValueError:
+                    pass  # not a date; the request itself will report it
+                else:
+                    other_kwargs = sorted(kw for kw in kwargs.items() if kw[0] != "target_date")
+                    key = (func.__name__, (iso_date, *args[1:]), tuple(other_kwargs))
+
+            cached = self._cache.get(key, _MISSING)
+            if cached is not _MISSING:
+                return cached
+
+            result = func(self, *args, **kwargs)
+            if result is not None:
+                historical = target is not None and _is_historical(target)
+                self._cache.set(key, result, ttl=HISTORICAL_CACHE_TTL if historical else ttl)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+# Health snapshot sections: (key, async getter, fields). A section is either
+# the record's to_dict() (fields is None) or a selection of its attributes
+# given as (output name, attribute) pairs. Sleep is for the night ending on
+# the snapshot date.
+_SNAPSHOT_FIELDS: tuple[tuple[str, str, tuple[tuple[str, str], ...] | None], ...] = (
+    ("daily_summary", "aget_daily_summary", None),
+    ("sleep", "aget_sleep", None),
+    (
+        "heart_rate",
+        "aget_heart_rate",
+        (
+            ("resting", "resting_heart_rate"),
+            ("max", "max_heart_rate"),
+            ("min", "min_heart_rate"),
+            ("avg", "avg_heart_rate"),
+        ),
+    ),
+    (
+        "stress",
+        "aget_stress",
+        (
+            ("avg_level", "avg_stress_level"),
+            ("max_level", "max_stress_level"),
+            ("rest_hours", "rest_duration_hours"),
+            ("high_stress_hours", "high_stress_hours"),
+        ),
+    ),
+    (
+        "steps",
+        "aget_steps",
+        (
+            ("total", "total_steps"),
+            ("goal", "step_goal"),
+            ("goal_reached", "goal_reached"),
+            ("distance_km", "total_distance_km"),
+            ("floors_ascended", "floors_ascended"),
+            ("intensity_minutes", "total_intensity_minutes"),
+        ),
+    ),
+    (
+        "hydration",
+        "aget_hydration",
+        (
+            ("intake_ml", "total_intake_ml"),
+            ("goal_ml", "goal_ml"),
+            ("goal_percentage", "goal_percentage"),
+        ),
+    ),
+    (
+        "respiration",
+        "aget_respiration",
+        (
+            ("avg_waking", "avg_waking_respiration"),
+            ("avg_sleeping", "avg_sleeping_respiration"),
+            ("highest", "highest_respiration"),
+            ("lowest", "lowest_respiration"),
+        ),
+    ),
+)
+
+
+@functools.cache
+def _fetch_errors() -> tuple[type[Exception], ...]:
+    """Get the exception types that mean data could not be fetched."""
+    # Only called once requests have been made, so garth is already loaded
+    from garth.exc import GarthException
+    from requests import RequestException
+
+    from garmer.auth import AuthenticationError
+
+    # ValueError covers malformed responses (including pydantic's
+    # ValidationError) and bad date arguments
+    return (AuthenticationError, GarthException, RequestException, ValueError)
+
+
+def _fetch_failed(result: Any) -> bool:
+    """
+    Check whether a result gathered with return_exceptions is a fetch error.
+
+    Args:
+        result: Result or exception returned by asyncio.gather()
+
+    Returns:
+        True if fetching the data failed in an expected way (HTTP,
+        authentication or response errors), False for a regular result
+
+    Raises:
+        Any other exception in result, since it points to a bug (or a
+        cancellation) rather than to missing data
+    """
+    if not isinstance(result, BaseException):
+        return False
+    if isinstance(result, _fetch_errors()):
+        return True
+    raise result
+
+
+def _norm_date(target_date: date | datetime | str | None) -> tuple[date, str]:
+    """
+    Normalize a date argument.
+
+    Args:
+        target_date: Date, datetime, YYYY-MM-DD string, or None for today
+
+    Returns:
+        Tuple of (date, ISO date string)
+
+    Raises:
+        ValueError: If a string is not a YYYY-MM-DD date
+    """
+    target = BaseExtractor._to_date(target_date) if target_date else date.today()
+    return target, target.isoformat()
+
+
+def _is_historical(target: date) -> bool:
+    """Check whether a date is before yesterday, so its data is final."""
+    return target.toordinal() < date.today().toordinal() - 1
+
 
 class GarminClient:
     """
@@ -60,13 +254,26 @@ class GarminClient:
 
         # Get comprehensive health snapshot
         snapshot = client.get_health_snapshot()
+
+        # Fetch several endpoints concurrently (from inside a coroutine)
+        async with GarminClient.from_saved_tokens() as client:
+            summary, sleep = await asyncio.gather(
+                client.aget_daily_summary(),
+                client.aget_sleep(),
+            )
         ```
     """
 
+    # Maximum number of Garmin requests in flight at once for the async API.
+    # Keeps us under garth's connection pool size and Garmin's rate limits.
+    MAX_CONCURRENT_REQUESTS = 6
+
     def __init__(
         self,
         auth: GarminAuth | None = None,
         token_dir: Path | str | None = None,
+        cache_enabled: bool = True,
+        cache: TTLCache | SQLiteCache | None = None,
     ):
         """
         Initialize the Garmin client.
@@ -74,18 +281,74 @@ class GarminClient:
         Args:
             auth: Optional pre-configured GarminAuth instance
             token_dir: Directory to store authentication tokens
+            cache_enabled: Whether to cache endpoint results
+            cache: Cache to use instead of the default in-memory TTLCache,
+                   e.g. a SQLiteCache to share results across processes
         """
         self.auth = auth or GarminAuth(token_dir=token_dir)
+        self._cache: TTLCache | SQLiteCache | None = None
+        self._coalescer: RequestCoalescer | None = None
+        if cache_enabled:
+            self._cache = (
+                cache if cache is not None else TTLCache(maxsize=256, ttl=DEFAULT_CACHE_TTL)
+            )
+            # Raw responses are only shared briefly, so realtime data stays fresh
+            self._coalescer = RequestCoalescer(ttl=REALTIME_CACHE_TTL)
+
+        # Worker pool backing the async API (created on first use)
+        self._executor: ThreadPoolExecutor | None = None
+
+    # Extractors are created (and their modules imported) on first use, so a
+    # client only pays for the data types it actually requests. They are
+    # lazily authenticated.
+
+    @functools.cached_property
+    def _activities(self) -> "ActivityExtractor":
+        from garmer.extractors.activities import ActivityExtractor
 
-        # Initialize extractors (they will be lazily authenticated)
-        self._activities = ActivityExtractor(self.auth)
-        self._sleep = SleepExtractor(self.auth)
-        self._heart_rate = HeartRateExtractor(self.auth)
-        self._stress = StressExtractor(self.auth)
-        self._steps = StepsExtractor(self.auth)
-        self._daily = DailyExtractor(self.auth)
-        self._body = BodyExtractor(self.auth)
-        self._user = UserExtractor(self.auth)
+        return ActivityExtractor(self.auth, self._coalescer)
+
+    @functools.cached_property
+    def _sleep(self) -> "SleepExtractor":
+        from garmer.extractors.sleep import SleepExtractor
+
+        return SleepExtractor(self.auth, self._coalescer)
+
+    @functools.cached_property
+    def _heart_rate(self) -> "HeartRateExtractor":
+        from garmer.extractors.heart_rate import HeartRateExtractor
+
+        return HeartRateExtractor(self.auth, self._coalescer)
+
+    @functools.cached_property
+    def _stress(self) -> "StressExtractor":
+        from garmer.extractors.stress import StressExtractor
+
+        return StressExtractor(self.auth, self._coalescer)
+
+    @functools.cached_property
+    def _steps(self) -> "StepsExtractor":
+        from garmer.extractors.steps import StepsExtractor
+
+        return StepsExtractor(self.auth, self._coalescer)
+
+    @functools.cached_property
+    def _daily(self) -> "DailyExtractor":
+        from garmer.extractors.daily import DailyExtractor
+
+        return DailyExtractor(self.auth, self._coalescer)
+
+    @functools.cached_property
+    def _body(self) -> "BodyExtractor":
+        from garmer.extractors.body import BodyExtractor
+
+        return BodyExtractor(self.auth, self._coalescer)
+
+    @functools.cached_property
+    def _user(self) -> "UserExtractor":
+        from garmer.extractors.user import UserExtractor
+
+        return UserExtractor(self.auth)
 
     @classmethod
     def from_credentials(
@@ -115,12 +378,14 @@ class GarminClient:
     def from_saved_tokens(
         cls,
         token_dir: Path | str | None = None,
+        cache: TTLCache | SQLiteCache | None = None,
     ) -> "GarminClient":
         """
         Create a client using saved authentication tokens.
 
         Args:
             token_dir: Directory containing saved tokens
+            cache: Optional cache to use instead of the default in-memory one
 
         Returns:
             GarminClient instance (may not be authenticated if no tokens found)
@@ -134,7 +399,7 @@ class GarminClient:
             raise AuthenticationError(
                 "No saved tokens found. Please login with credentials first."
             )
-        return cls(auth=auth)
+        return cls(auth=auth, cache=cache)
 
     def login(
         self,
@@ -153,6 +418,7 @@ class GarminClient:
         Returns:
             True if login was successful
         """
+        self.flush_cache()
         return self.auth.login(email, password, save_tokens=save_tokens)
 
     def logout(self, delete_tokens: bool = True) -> None:
@@ -162,6 +428,7 @@ class GarminClient:
         Args:
             delete_tokens: Whether to delete saved tokens
         """
+        self.flush_cache()
         self.auth.logout(delete_tokens=delete_tokens)
 
     @property
@@ -169,14 +436,48 @@ class GarminClient:
         """Check if the client is authenticated."""
         return self.auth.is_authenticated
 
+    def flush_cache(self) -> None:
+        """Discard all cached endpoint results."""
+        if self._cache is not None:
+            self._cache.clear()
+        if self._coalescer is not None:
+            self._coalescer.clear()
+
+    def close(self) -> None:
+        """
+        Release resources held by the client.
+
+        Shuts down the worker pool used by the async API. HTTP connections
+        are pooled and kept alive by garth's shared session, so they are
+        reused by any later client in the same process.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> "GarminClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "GarminClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        # Shutting down waits for in-flight requests, so do it off the loop
+        await asyncio.to_thread(self.close)
+
     # -------------------------------------------------------------------------
     # User Profile Methods
     # -------------------------------------------------------------------------
 
+    @_ttl_cached(ttl=STATIC_CACHE_TTL)
     def get_user_profile(self) -> UserProfile | None:
         """Get the user's profile information."""
         return self._user.get_profile()
 
+    @_ttl_cached(ttl=STATIC_CACHE_TTL)
     def get_user_devices(self) -> list[dict[str, Any]]:
         """Get the user's registered Garmin devices."""
         return self._user.get_devices()
@@ -185,6 +486,7 @@ class GarminClient:
     # Activity Methods
     # -------------------------------------------------------------------------
 
+    @_ttl_cached(ttl=DEFAULT_CACHE_TTL)
     def get_activities(
         self,
         start_date: date | datetime | str | None = None,
@@ -211,10 +513,12 @@ class GarminClient:
             limit=limit,
         )
 
+    @_ttl_cached(ttl=DEFAULT_CACHE_TTL)
     def get_recent_activities(self, limit: int = 10) -> list[Activity]:
         """Get the most recent activities."""
         return self._activities.get_recent_activities(limit=limit)
 
+    @_ttl_cached(ttl=DEFAULT_CACHE_TTL)
     def get_activity(self, activity_id: int) -> Activity | None:
         """Get a specific activity by ID."""
         return self._activities.get_activity_by_id(activity_id)
@@ -223,6 +527,7 @@ class GarminClient:
     # Sleep Methods
     # -------------------------------------------------------------------------
 
+    @_ttl_cached(ttl=DEFAULT_CACHE_TTL, dated=True)
     def get_sleep(
         self,
         target_date: date | datetime | str | None = None,
@@ -239,13 +544,26 @@ class GarminClient:
         target_date = target_date or date.today()
         return self._sleep.get_for_date(target_date)
 
+    @_ttl_cached(ttl=DEFAULT_CACHE_TTL)
     def get_sleep_range(
         self,
         start_date: date | datetime | str,
         end_date: date | datetime | str,
     ) -> list[SleepData]:
-        """Get sleep data for a date range."""
-        return self._sleep.get_for_date_range(start_date, end_date)
+        """
+        Get sleep data for a date range.
+
+        Garmin has no ranged endpoint for detailed sleep data, so the
+        per-day requests are issued concurrently; see aget_sleep_range().
+
+        Args:
+            start_date: Start date
+            end_date: End date
+
+        Returns:
+            List of sleep data for each date with data, in date order
+        """
+        return self._run_sync(self.aget_sleep_range(start_date, end_date))
 
     def get_last_night_sleep(self) -> SleepData | None:
         """Get last night's sleep data."""
@@ -255,6 +573,7 @@ class GarminClient:
     # Heart Rate Methods
     # -------------------------------------------------------------------------
 
+    @_ttl_cached(ttl=DEFAULT_CACHE_TTL, dated=True)
     def get_heart_rate(
         self,
         target_date: date | datetime | str | None = None,
@@ -271,6 +590,7 @@ class GarminClient:
         target_date = target_date or date.today()
         return self._heart_rate.get_for_date(target_date)
 
+    @_ttl_cached(ttl=DEFAULT_CACHE_TTL, dated=True)
     def get_resting_heart_rate(
         self,
         target_date: date | datetime | str | None = None,
@@ -283,6 +603,7 @@ class GarminClient:
     # Stress Methods
     # -------------------------------------------------------------------------
 
+    @_ttl_cached(ttl=REALTIME_CACHE_TTL, dated=True)
     def get_stress(
         self,
         target_date: date | datetime | str | None = None,
@@ -299,6 +620,7 @@ class GarminClient:
         target_date = target_date or date.today()
         return self._stress.get_for_date(target_date)
 
+    @_ttl_cached(ttl=REALTIME_CACHE_TTL, dated=True)
     def get_body_battery(
         self,
         target_date: date | datetime | str | None = None,
@@ -311,6 +633,7 @@ class GarminClient:
     # Steps Methods
     # -------------------------------------------------------------------------
 
+    @_ttl_cached(ttl=DEFAULT_CACHE_TTL, dated=True)
     def get_steps(
         self,
         target_date: date | datetime | str | None = None,
@@ -327,6 +650,7 @@ class GarminClient:
         target_date = target_date or date.today()
         return self._steps.get_for_date(target_date)
 
+    @_ttl_cached(ttl=DEFAULT_CACHE_TTL, dated=True)
     def get_total_steps(
         self,
         target_date: date | datetime | str | None = None,
@@ -339,6 +663,7 @@ class GarminClient:
     # Daily Summary Methods
     # -------------------------------------------------------------------------
 
+    @_ttl_cached(ttl=DEFAULT_CACHE_TTL, dated=True)
     def get_daily_summary(
         self,
         target_date: date | datetime | str | None = None,
@@ -355,6 +680,7 @@ class GarminClient:
         target_date = target_date or date.today()
         return self._daily.get_for_date(target_date)
 
+    @_ttl_cached(ttl=DEFAULT_CACHE_TTL)
     def get_weekly_summary(self) -> dict:
         """Get summary for the current week."""
         return self._daily.get_weekly_summary()
@@ -363,6 +689,7 @@ class GarminClient:
     # Body Composition Methods
     # -------------------------------------------------------------------------
 
+    @_ttl_cached(ttl=DEFAULT_CACHE_TTL, dated=True)
     def get_weight(
         self,
         target_date: date | datetime | str | None = None,
@@ -371,18 +698,40 @@ class GarminClient:
         target_date = target_date or date.today()
         return self._body.get_weight_for_date(target_date)
 
+    @_ttl_cached(ttl=DEFAULT_CACHE_TTL)
     def get_latest_weight(self) -> Weight | None:
         """Get the most recent weight measurement."""
         return self._body.get_latest_weight()
 
+    @_ttl_cached(ttl=DEFAULT_CACHE_TTL)
     def get_body_composition(
         self,
         target_date: date | datetime | str | None = None,
+        fallback_to_latest: bool = False,
     ) -> BodyComposition | None:
-        """Get body composition for a date."""
-        target_date = target_date or date.today()
-        return self._body.get_for_date(target_date)
+        """
+        Get body composition for a date.
+
+        Body composition includes weight, so prefer this over a separate
+        get_latest_weight() call when both are needed.
+
+        Args:
+            target_date: Date to get body composition for (defaults to today)
+            fallback_to_latest: If there is no weight for the date, return the
+                                latest weigh-in as a weight-only composition
 
+        Returns:
+            Body composition or None
+        """
+        target_date = target_date or date.today()
+        body = self._body.get_for_date(target_date)
+        if fallback_to_latest and (body is None or not body.weight_grams):
+            weight = self.get_latest_weight()
+            if weight:
+                body = BodyComposition.from_weight(weight)
+        return body
+
+    @_ttl_cached(ttl=DEFAULT_CACHE_TTL, dated=True)
     def get_hydration(
         self,
         target_date: date | datetime | str | None = None,
@@ -391,6 +740,7 @@ class GarminClient:
         target_date = target_date or date.today()
         return self._body.get_hydration_for_date(target_date)
 
+    @_ttl_cached(ttl=DEFAULT_CACHE_TTL, dated=True)
     def get_respiration(
         self,
         target_date: date | datetime | str | None = None,
@@ -411,7 +761,8 @@ class GarminClient:
         Get a comprehensive health snapshot for a date.
 
         This method is designed for MoltBot integration, providing all
-        relevant health metrics in a single call.
+        relevant health metrics in a single call. The underlying endpoints
+        are requested concurrently; see aget_health_snapshot().
 
         Args:
             target_date: Date to get snapshot for (defaults to today)
@@ -419,112 +770,397 @@ class GarminClient:
         Returns:
             Dictionary containing all health metrics
         """
-        target_date = target_date or date.today()
-
-        snapshot = {
-            "date": str(target_date),
-            "daily_summary": None,
-            "sleep": None,
-            "heart_rate": None,
-            "stress": None,
-            "steps": None,
-            "hydration": None,
-            "respiration": None,
-        }
+        return self._run_sync(self.aget_health_snapshot(target_date))
 
-        # Get daily summary
-        try:
-            daily = self.get_daily_summary(target_date)
-            if daily:
-                snapshot["daily_summary"] = daily.to_dict()
-        except Exception as e:
-            logger.warning(f"Failed to get daily summary: {e}")
+    def get_health_snapshots(
+        self,
+        dates: Iterable[date | datetime | str],
+    ) -> dict[date, dict[str, Any]]:
+        """
+        Get health snapshots for several dates.
 
-        # Get sleep (for the night ending on this date)
-        try:
-            sleep = self.get_sleep(target_date)
-            if sleep:
-                snapshot["sleep"] = sleep.to_dict()
-        except Exception as e:
-            logger.warning(f"Failed to get sleep data: {e}")
+        The requests for all dates and metrics share the client's worker
+        pool and connections, so e.g. a week of snapshots takes about as
+        long as the slowest few requests rather than 49 requests in turn.
+        See aget_health_snapshots().
 
-        # Get heart rate
-        try:
-            hr = self.get_heart_rate(target_date)
-            if hr:
-                snapshot["heart_rate"] = {
-                    "resting": hr.resting_heart_rate,
-                    "max": hr.max_heart_rate,
-                    "min": hr.min_heart_rate,
-                    "avg": hr.avg_heart_rate,
-                }
-        except Exception as e:
-            logger.warning(f"Failed to get heart rate data: {e}")
-
-        # Get stress
-        try:
-            stress = self.get_stress(target_date)
-            if stress:
-                snapshot["stress"] = {
-                    "avg_level": stress.avg_stress_level,
-                    "max_level": stress.max_stress_level,
-                    "rest_hours": stress.rest_duration_hours,
-                    "high_stress_hours": stress.high_stress_hours,
-                }
-        except Exception as e:
-            logger.warning(f"Failed to get stress data: {e}")
-
-        # Get steps
-        try:
-            steps = self.get_steps(target_date)
-            if steps:
-                snapshot["steps"] = {
-                    "total": steps.total_steps,
-                    "goal": steps.step_goal,
-                    "goal_reached": steps.goal_reached,
-                    "distance_km": steps.total_distance_km,
-                    "floors_ascended": steps.floors_ascended,
-                    "intensity_minutes": steps.total_intensity_minutes,
-                }
-        except Exception as e:
-            logger.warning(f"Failed to get steps data: {e}")
-
-        # Get hydration
-        try:
-            hydration = self.get_hydration(target_date)
-            if hydration:
-                snapshot["hydration"] = {
-                    "intake_ml": hydration.total_intake_ml,
-                    "goal_ml": hydration.goal_ml,
-                    "goal_percentage": hydration.goal_percentage,
-                }
-        except Exception as e:
-            logger.warning(f"Failed to get hydration data: {e}")
-
-        # Get respiration
-        try:
-            respiration = self.get_respiration(target_date)
-            if respiration:
-                snapshot["respiration"] = {
-                    "avg_waking": respiration.avg_waking_respiration,
-                    "avg_sleeping": respiration.avg_sleeping_respiration,
-                    "highest": respiration.highest_respiration,
-                    "lowest": respiration.lowest_respiration,
-                }
-        except Exception as e:
-            logger.warning(f"Failed to get respiration data: {e}")
+        Args:
+            dates: Dates to get snapshots for
 
-        return snapshot
+        Returns:
+            Dictionary mapping each date to its snapshot, in the given order
+        """
+        return self._run_sync(self.aget_health_snapshots(dates))
 
     def get_weekly_health_report(self) -> dict[str, Any]:
         """
         Get a comprehensive weekly health report.
 
+        The per-metric statistics are requested concurrently; see
+        aget_weekly_health_report().
+
         Returns:
             Dictionary containing weekly health metrics and trends
         """
+        return self._run_sync(self.aget_weekly_health_report())
+
+    def export_data(
+        self,
+        start_date: date | datetime | str,
+        end_date: date | datetime | str,
+        include_activities: bool = True,
+        include_sleep: bool = True,
+        include_daily: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Export comprehensive data for a date range.
+
+        Useful for data analysis or backup. The requested datasets, and the
+        per-day requests within each of them, are fetched concurrently; see
+        aexport_data().
+
+        Args:
+            start_date: Start date
+            end_date: End date
+            include_activities: Include activity data
+            include_sleep: Include sleep data
+            include_daily: Include daily summaries
+
+        Returns:
+            Dictionary with all requested data
+        """
+        return self._run_sync(
+            self.aexport_data(
+                start_date,
+                end_date,
+                include_activities=include_activities,
+                include_sleep=include_sleep,
+                include_daily=include_daily,
+            )
+        )
+
+    def iter_export_data(
+        self,
+        start_date: date | datetime | str,
+        end_date: date | datetime | str,
+        include_activities: bool = True,
+        include_sleep: bool = True,
+        include_daily: bool = True,
+    ) -> Iterator[tuple[str, Iterator[dict[str, Any]]]]:
+        """
+        Export data for a date range one record at a time.
+
+        Fetches the same data as export_data(), but yields each dataset as a
+        (key, records) pair where records converts one record to a dictionary
+        at a time. This lets callers stream a long export to disk without
+        holding every converted record in memory.
+
+        The data is fetched when this method is called, not on the first
+        iteration, so fetch failures surface before the caller starts
+        writing output.
+
+        Args:
+            start_date: Start date
+            end_date: End date
+            include_activities: Include activity data
+            include_sleep: Include sleep data
+            include_daily: Include daily summaries
+
+        Returns:
+            Iterator of (dataset key, iterator of record dictionaries) pairs
+        """
+        datasets = self._run_sync(
+            self._afetch_export(
+                start_date, end_date, include_activities, include_sleep, include_daily
+            )
+        )
+        return (
+            (key, (record.to_dict() for record in records))
+            for key, records in datasets.items()
+        )
+
+    # -------------------------------------------------------------------------
+    # Async Methods
+    # -------------------------------------------------------------------------
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the worker pool used to run blocking requests for the async API."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.MAX_CONCURRENT_REQUESTS,
+                thread_name_prefix="garmer",
+            )
+        return self._executor
+
+    def _run_sync(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run an async aggregate to completion for the sync API.
+
+        asyncio.run() cannot be used while an event loop is running in this
+        thread (Jupyter, an async bot host), and blocking that loop would
+        stall it. In that case the coroutine is driven on a private loop in a
+        helper thread instead; its requests still run on the client's worker
+        pool.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        # A separate thread rather than the worker pool, so that the driver
+        # never occupies a worker its own requests are waiting for.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="garmer-sync") as runner:
+            return runner.submit(asyncio.run, coro).result()
+
+    async def _arun(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking client call without blocking the event loop.
+
+        garth performs synchronous HTTP requests, so calls are dispatched to a
+        bounded worker pool. This lets independent requests overlap their
+        network wait time while capping the number of concurrent sockets.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), partial(func, *args, **kwargs)
+        )
+
+    async def aget_user_profile(self) -> UserProfile | None:
+        """Async variant of get_user_profile()."""
+        return await self._arun(self.get_user_profile)
+
+    async def aget_user_devices(self) -> list[dict[str, Any]]:
+        """Async variant of get_user_devices()."""
+        return await self._arun(self.get_user_devices)
+
+    async def aget_activities(
+        self,
+        start_date: date | datetime | str | None = None,
+        end_date: date | datetime | str | None = None,
+        activity_type: str | None = None,
+        limit: int = 20,
+    ) -> list[Activity]:
+        """Async variant of get_activities()."""
+        return await self._arun(
+            self.get_activities,
+            start_date=start_date,
+            end_date=end_date,
+            activity_type=activity_type,
+            limit=limit,
+        )
+
+    async def aget_recent_activities(self, limit: int = 10) -> list[Activity]:
+        """Async variant of get_recent_activities()."""
+        return await self._arun(self.get_recent_activities, limit=limit)
+
+    async def aget_activity(self, activity_id: int) -> Activity | None:
+        """Async variant of get_activity()."""
+        return await self._arun(self.get_activity, activity_id)
+
+    async def aget_sleep(
+        self,
+        target_date: date | datetime | str | None = None,
+    ) -> SleepData | None:
+        """Async variant of get_sleep()."""
+        return await self._arun(self.get_sleep, target_date)
+
+    async def aget_sleep_range(
+        self,
+        start_date: date | datetime | str,
+        end_date: date | datetime | str,
+    ) -> list[SleepData]:
+        """Async variant of get_sleep_range()."""
+        return await self._agather_range(
+            self.aget_sleep, start_date, end_date, "sleep data"
+        )
+
+    async def aget_heart_rate(
+        self,
+        target_date: date | datetime | str | None = None,
+    ) -> HeartRateData | None:
+        """Async variant of get_heart_rate()."""
+        return await self._arun(self.get_heart_rate, target_date)
+
+    async def aget_resting_heart_rate(
+        self,
+        target_date: date | datetime | str | None = None,
+    ) -> int | None:
+        """Async variant of get_resting_heart_rate()."""
+        return await self._arun(self.get_resting_heart_rate, target_date)
+
+    async def aget_stress(
+        self,
+        target_date: date | datetime | str | None = None,
+    ) -> StressData | None:
+        """Async variant of get_stress()."""
+        return await self._arun(self.get_stress, target_date)
+
+    async def aget_body_battery(
+        self,
+        target_date: date | datetime | str | None = None,
+    ) -> dict | None:
+        """Async variant of get_body_battery()."""
+        return await self._arun(self.get_body_battery, target_date)
+
+    async def aget_steps(
+        self,
+        target_date: date | datetime | str | None = None,
+    ) -> StepsData | None:
+        """Async variant of get_steps()."""
+        return await self._arun(self.get_steps, target_date)
+
+    async def aget_total_steps(
+        self,
+        target_date: date | datetime | str | None = None,
+    ) -> int | None:
+        """Async variant of get_total_steps()."""
+        return await self._arun(self.get_total_steps, target_date)
+
+    async def aget_daily_summary(
+        self,
+        target_date: date | datetime | str | None = None,
+    ) -> DailySummary | None:
+        """Async variant of get_daily_summary()."""
+        return await self._arun(self.get_daily_summary, target_date)
+
+    async def aget_weekly_summary(self) -> dict:
+        """Async variant of get_weekly_summary()."""
+        return await self._arun(self.get_weekly_summary)
+
+    async def aget_weight(
+        self,
+        target_date: date | datetime | str | None = None,
+    ) -> Weight | None:
+        """Async variant of get_weight()."""
+        return await self._arun(self.get_weight, target_date)
+
+    async def aget_latest_weight(self) -> Weight | None:
+        """Async variant of get_latest_weight()."""
+        return await self._arun(self.get_latest_weight)
+
+    async def aget_body_composition(
+        self,
+        target_date: date | datetime | str | None = None,
+        fallback_to_latest: bool = False,
+    ) -> BodyComposition | None:
+        """Async variant of get_body_composition()."""
+        return await self._arun(self.get_body_composition, target_date, fallback_to_latest)
+
+    async def aget_hydration(
+        self,
+        target_date: date | datetime | str | None = None,
+    ) -> HydrationData | None:
+        """Async variant of get_hydration()."""
+        return await self._arun(self.get_hydration, target_date)
+
+    async def aget_respiration(
+        self,
+        target_date: date | datetime | str | None = None,
+    ) -> RespirationData | None:
+        """Async variant of get_respiration()."""
+        return await self._arun(self.get_respiration, target_date)
+
+    async def _agather(self, **coros: Any) -> dict[str, Any]:
+        """
+        Await named coroutines concurrently.
+
+        A coroutine that fails to fetch its data is logged and mapped to
+        None so that one unavailable endpoint doesn't break an aggregate
+        result; other exceptions propagate (see _fetch_failed()).
+
+        Returns:
+            Dictionary mapping each name to its result (or None on failure)
+        """
+        results = await asyncio.gather(*coros.values(), return_exceptions=True)
+        gathered: dict[str, Any] = {}
+        for name, result in zip(coros, results):
+            if _fetch_failed(result):
+                logger.warning(f"Failed to get {name.replace('_', ' ')}: {result}")
+                result = None
+            gathered[name] = result
+        return gathered
+
+    async def _agather_range(
+        self,
+        afetch: Callable[[date], Any],
+        start_date: date | datetime | str,
+        end_date: date | datetime | str,
+        name: str,
+    ) -> list[Any]:
+        """
+        Fetch per-day data for every date in a range concurrently.
+
+        Args:
+            afetch: Coroutine function fetching data for a single date
+            start_date: Start date
+            end_date: End date
+            name: Description of the data, used in log messages
+
+        Returns:
+            List of results for each date with data, in date order
+        """
+        days = self._daily.dates_in_range(start_date, end_date)
+        results = await asyncio.gather(*(afetch(d) for d in days), return_exceptions=True)
+        data = []
+        for d, result in zip(days, results):
+            if _fetch_failed(result):
+                logger.warning(f"Failed to get {name} for {d}: {result}")
+            elif result:
+                data.append(result)
+        return data
+
+    async def aget_health_snapshot(
+        self,
+        target_date: date | datetime | str | None = None,
+    ) -> dict[str, Any]:
+        """Async variant of get_health_snapshot()."""
+        target_date, iso_date = _norm_date(target_date)
+
+        results = await self._agather(
+            **{key: getattr(self, afetch)(target_date) for key, afetch, _ in _SNAPSHOT_FIELDS}
+        )
+
+        snapshot: dict[str, Any] = {"date": iso_date}
+        for key, _, fields in _SNAPSHOT_FIELDS:
+            data = results[key]
+            if not data:
+                snapshot[key] = None
+            elif fields is None:
+                snapshot[key] = data.to_dict()
+            else:
+                snapshot[key] = {name: getattr(data, attr) for name, attr in fields}
+
+        return snapshot
+
+    async def aget_health_snapshots(
+        self,
+        dates: Iterable[date | datetime | str],
+    ) -> dict[date, dict[str, Any]]:
+        """Async variant of get_health_snapshots()."""
+        days = list(dict.fromkeys(_norm_date(d)[0] for d in dates))
+        snapshots = await asyncio.gather(*(self.aget_health_snapshot(d) for d in days))
+        return dict(zip(days, snapshots))
+
+    async def aget_weekly_health_report(self) -> dict[str, Any]:
+        """Async variant of get_weekly_health_report()."""
         end_date = date.today()
-        start_date = end_date - timedelta(days=6)
+        start_date = end_date - _WEEK_DELTA
+
+        results = await self._agather(
+            activities=self.aget_activities(
+                start_date=start_date,
+                end_date=end_date,
+                limit=100,
+            ),
+            sleep_stats=self._arun(self._sleep.get_sleep_stats, start_date, end_date),
+            steps_stats=self._arun(self._steps.get_steps_stats, start_date, end_date),
+            heart_rate_stats=self._arun(
+                self._heart_rate.get_heart_rate_stats, start_date, end_date
+            ),
+            stress_stats=self._arun(
+                self._stress.get_stress_stats, start_date, end_date
+            ),
+        )
 
         report = {
             "period": {
@@ -539,26 +1175,26 @@ class GarminClient:
         }
 
         # Activities summary
-        try:
-            activities = self.get_activities(
-                start_date=start_date,
-                end_date=end_date,
-                limit=100,
-            )
-            if activities:
-                report["activities"] = {
-                    "count": len(activities),
-                    "total_duration_hours": sum(a.duration_seconds for a in activities) / 3600,
-                    "total_distance_km": sum(a.distance_meters for a in activities) / 1000,
-                    "total_calories": sum(a.calories for a in activities),
-                    "types": list(set(a.activity_type_key for a in activities)),
-                }
-        except Exception as e:
-            logger.warning(f"Failed to get activities: {e}")
+        activities = results["activities"]
+        if activities:
+            total_duration = total_distance = total_calories = 0
+            types: dict[str, None] = {}  # ordered set, in order of first appearance
+            for a in activities:
+                total_duration += a.duration_seconds
+                total_distance += a.distance_meters
+                total_calories += a.calories
+                types[a.activity_type_key] = None
+            report["activities"] = {
+                "count": len(activities),
+                "total_duration_hours": total_duration / 3600,
+                "total_distance_km": total_distance / 1000,
+                "total_calories": total_calories,
+                "types": list(types),
+            }
 
         # Sleep summary
-        try:
-            sleep_stats = self._sleep.get_sleep_stats(start_date, end_date)
+        sleep_stats = results["sleep_stats"]
+        if sleep_stats is not None:
             report["sleep"] = {
                 "days_with_data": sleep_stats.get("days_with_data", 0),
                 "avg_hours": sleep_stats.get("avg_sleep_hours", 0),
@@ -566,46 +1202,38 @@ class GarminClient:
                 "avg_rem_hours": sleep_stats.get("avg_rem_sleep_hours", 0),
                 "avg_score": sleep_stats.get("avg_sleep_score"),
             }
-        except Exception as e:
-            logger.warning(f"Failed to get sleep stats: {e}")
 
         # Steps summary
-        try:
-            steps_stats = self._steps.get_steps_stats(start_date, end_date)
+        steps_stats = results["steps_stats"]
+        if steps_stats is not None:
             report["steps"] = {
                 "total": steps_stats.get("total_steps", 0),
                 "avg_daily": steps_stats.get("avg_daily_steps", 0),
                 "max_day": steps_stats.get("max_steps_day", 0),
                 "days_goal_reached": steps_stats.get("days_goal_reached", 0),
             }
-        except Exception as e:
-            logger.warning(f"Failed to get steps stats: {e}")
 
         # Heart rate summary
-        try:
-            hr_stats = self._heart_rate.get_heart_rate_stats(start_date, end_date)
+        hr_stats = results["heart_rate_stats"]
+        if hr_stats is not None:
             report["heart_rate"] = {
                 "avg_resting": hr_stats.get("avg_resting_hr"),
                 "min_resting": hr_stats.get("min_resting_hr"),
                 "max_resting": hr_stats.get("max_resting_hr"),
             }
-        except Exception as e:
-            logger.warning(f"Failed to get heart rate stats: {e}")
 
         # Stress summary
-        try:
-            stress_stats = self._stress.get_stress_stats(start_date, end_date)
+        stress_stats = results["stress_stats"]
+        if stress_stats is not None:
             report["stress"] = {
                 "avg_level": stress_stats.get("avg_stress_level"),
                 "avg_rest_hours": stress_stats.get("avg_rest_hours", 0),
                 "avg_high_stress_hours": stress_stats.get("avg_high_stress_hours", 0),
             }
-        except Exception as e:
-            logger.warning(f"Failed to get stress stats: {e}")
 
         return report
 
-    def export_data(
+    async def aexport_data(
         self,
         start_date: date | datetime | str,
         end_date: date | datetime | str,
@@ -613,54 +1241,58 @@ class GarminClient:
         include_sleep: bool = True,
         include_daily: bool = True,
     ) -> dict[str, Any]:
-        """
-        Export comprehensive data for a date range.
-
-        Useful for data analysis or backup.
-
-        Args:
-            start_date: Start date
-            end_date: End date
-            include_activities: Include activity data
-            include_sleep: Include sleep data
-            include_daily: Include daily summaries
-
-        Returns:
-            Dictionary with all requested data
-        """
-        export = {
+        """Async variant of export_data()."""
+        export: dict[str, Any] = {
             "period": {
                 "start": str(start_date),
                 "end": str(end_date),
             },
         }
+        datasets = await self._afetch_export(
+            start_date, end_date, include_activities, include_sleep, include_daily
+        )
+        for key, records in datasets.items():
+            export[key] = [record.to_dict() for record in records]
+        return export
 
+    async def _afetch_export(
+        self,
+        start_date: date | datetime | str,
+        end_date: date | datetime | str,
+        include_activities: bool,
+        include_sleep: bool,
+        include_daily: bool,
+    ) -> dict[str, list[Any]]:
+        """Fetch the requested export datasets concurrently, as model objects."""
+        # Dataset key -> (description for logging, coroutine)
+        datasets: dict[str, tuple[str, Any]] = {}
         if include_activities:
-            try:
-                activities = self.get_activities(
-                    start_date=start_date,
-                    end_date=end_date,
-                    limit=1000,
-                )
-                export["activities"] = [a.to_dict() for a in activities]
-            except Exception as e:
-                logger.warning(f"Failed to export activities: {e}")
-                export["activities"] = []
-
+            datasets["activities"] = (
+                "activities",
+                self.aget_activities(start_date=start_date, end_date=end_date, limit=1000),
+            )
         if include_sleep:
-            try:
-                sleep_data = self._sleep.get_for_date_range(start_date, end_date)
-                export["sleep"] = [s.to_dict() for s in sleep_data]
-            except Exception as e:
-                logger.warning(f"Failed to export sleep data: {e}")
-                export["sleep"] = []
-
+            datasets["sleep"] = (
+                "sleep data",
+                self.aget_sleep_range(start_date, end_date),
+            )
         if include_daily:
-            try:
-                daily_data = self._daily.get_for_date_range(start_date, end_date)
-                export["daily_summaries"] = [d.to_dict() for d in daily_data]
-            except Exception as e:
-                logger.warning(f"Failed to export daily summaries: {e}")
-                export["daily_summaries"] = []
+            datasets["daily_summaries"] = (
+                "daily summaries",
+                self._agather_range(
+                    self.aget_daily_summary, start_date, end_date, "daily summary"
+                ),
+            )
 
-        return export
+        results = await asyncio.gather(
+            *(coro for _, coro in datasets.values()), return_exceptions=True
+        )
+        fetched: dict[str, list[Any]] = {}
+        for (key, (name, _)), result in zip(datasets.items(), results):
+            if _fetch_failed(result):
+                logger.warning(f"Failed to export {name}: {result}")
+                fetched[key] = []
+            else:
+                fetched[key] = result
+
+        return fetched
@@ -1,16 +1,38 @@
 """Configuration management for Garmer."""
 
-import json
 import logging
 import os
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+from garmer import _json
+
 logger = logging.getLogger(__name__)
 
 
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable value."""
+    return value.lower() in ("true", "1", "yes")
+
+
+# Environment variable -> (config key, converter from the variable's string)
+_ENV_MAPPINGS: dict[str, tuple[str, Callable[[str], Any]]] = {
+    "GARMER_TOKEN_DIR": ("token_dir", Path),
+    "GARMER_TOKEN_FILE": ("token_file", str),
+    "GARMER_LOG_LEVEL": ("log_level", str),
+    "GARMER_LOG_FILE": ("log_file", Path),
+    "GARMER_EXPORT_DIR": ("export_dir", Path),
+    "GARMER_EXPORT_FORMAT": ("export_format", str),
+    "GARMER_CACHE_ENABLED": ("cache_enabled", _parse_bool),
+    "GARMER_CACHE_TTL": ("cache_ttl_seconds", int),
+    "GARMER_REQUEST_TIMEOUT": ("request_timeout", int),
+    "GARMER_MAX_RETRIES": ("max_retries", int),
+}
+
+
 class GarmerConfig(BaseModel):
     """Configuration settings for Garmer."""
 
@@ -53,8 +75,8 @@ class GarmerConfig(BaseModel):
             return cls()
 
         try:
-            with open(config_path) as f:
-                data = json.load(f)
+            with open(config_path, "rb") as f:
+                data = _json.loads(f.read())
             return cls.model_validate(data)
         except Exception as e:
             logger.warning(f"Failed to load config from {config_path}: {e}")
@@ -71,35 +93,7 @@ class GarmerConfig(BaseModel):
         Returns:
             GarmerConfig instance
         """
-        config_data: dict[str, Any] = {}
-
-        env_mappings = {
-            "GARMER_TOKEN_DIR": "token_dir",
-            "GARMER_TOKEN_FILE": "token_file",
-            "GARMER_LOG_LEVEL": "log_level",
-            "GARMER_LOG_FILE": "log_file",
-            "GARMER_EXPORT_DIR": "export_dir",
-            "GARMER_EXPORT_FORMAT": "export_format",
-            "GARMER_CACHE_ENABLED": "cache_enabled",
-            "GARMER_CACHE_TTL": "cache_ttl_seconds",
-            "GARMER_REQUEST_TIMEOUT": "request_timeout",
-            "GARMER_MAX_RETRIES": "max_retries",
-        }
-
-        for env_var, config_key in env_mappings.items():
-            value = os.environ.get(env_var)
-            if value is not None:
-                # Handle type conversions
-                if config_key in ("cache_enabled",):
-                    config_data[config_key] = value.lower() in ("true", "1", "yes")
-                elif config_key in ("cache_ttl_seconds", "request_timeout", "max_retries"):
-                    config_data[config_key] = int(value)
-                elif config_key in ("token_dir", "log_file", "export_dir"):
-                    config_data[config_key] = Path(value)
-                else:
-                    config_data[config_key] = value
-
-        return cls.model_validate(config_data)
+        return cls.model_validate(_env_overrides())
 
     def save(self, config_path: Path | str) -> None:
         """
@@ -111,14 +105,11 @@ class GarmerConfig(BaseModel):
         config_path = Path(config_path)
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # mode="json" already turns Paths into strings
         data = self.model_dump(mode="json")
-        # Convert Path objects to strings
-        for key, value in data.items():
-            if isinstance(value, Path):
-                data[key] = str(value)
 
-        with open(config_path, "w") as f:
-            json.dump(data, f, indent=2)
+        with open(config_path, "wb") as f:
+            f.write(_json.dumpb(data, indent=True))
 
         logger.info(f"Saved configuration to {config_path}")
 
@@ -139,6 +130,15 @@ class GarmerConfig(BaseModel):
         )
 
 
+def _env_overrides() -> dict[str, Any]:
+    """Get the config values set through environment variables, by config key."""
+    return {
+        config_key: convert(value)
+        for env_var, (config_key, convert) in _ENV_MAPPINGS.items()
+        if (value := os.environ.get(env_var)) is not None
+    }
+
+
 def load_config() -> GarmerConfig:
     """
     Load configuration from standard locations.
@@ -159,15 +159,8 @@ def load_config() -> GarmerConfig:
     if default_config_path.exists():
         config = GarmerConfig.from_file(default_config_path)
 
-    # Override with environment variables
-    env_config = GarmerConfig.from_env()
+    # Override with the environment variables that are set
     config_dict = config.model_dump()
-    env_dict = env_config.model_dump()
-
-    # Merge env values that were explicitly set
-    for key in env_dict:
-        env_value = os.environ.get(f"GARMER_{key.upper()}")
-        if env_value is not None:
-            config_dict[key] = env_dict[key]
+    config_dict.update(_env_overrides())
 
     return GarmerConfig.model_validate(config_dict)
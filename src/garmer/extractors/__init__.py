@@ -1,13 +1,16 @@
 """Data extractors for Garmin Connect API."""
 
-from garmer.extractors.activities import ActivityExtractor
-from garmer.extractors.daily import DailyExtractor
-from garmer.extractors.heart_rate import HeartRateExtractor
-from garmer.extractors.sleep import SleepExtractor
-from garmer.extractors.steps import StepsExtractor
-from garmer.extractors.stress import StressExtractor
-from garmer.extractors.body import BodyExtractor
-from garmer.extractors.user import UserExtractor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from garmer.extractors.activities import ActivityExtractor
+    from garmer.extractors.body import BodyExtractor
+    from garmer.extractors.daily import DailyExtractor
+    from garmer.extractors.heart_rate import HeartRateExtractor
+    from garmer.extractors.sleep import SleepExtractor
+    from garmer.extractors.steps import StepsExtractor
+    from garmer.extractors.stress import StressExtractor
+    from garmer.extractors.user import UserExtractor
 
 __all__ = [
     "ActivityExtractor",
@@ -19,3 +22,32 @@ __all__ = [
     "BodyExtractor",
     "UserExtractor",
 ]
+
+# Extractors are resolved on first access (PEP 562) so that importing one of
+# them, or garmer.extractors.base, doesn't import all the others.
+_LAZY_EXPORTS = {
+    "ActivityExtractor": "garmer.extractors.activities",
+    "DailyExtractor": "garmer.extractors.daily",
+    "HeartRateExtractor": "garmer.extractors.heart_rate",
+    "SleepExtractor": "garmer.extractors.sleep",
+    "StepsExtractor": "garmer.extractors.steps",
+    "StressExtractor": "garmer.extractors.stress",
+    "BodyExtractor": "garmer.extractors.body",
+    "UserExtractor": "garmer.extractors.user",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_EXPORTS])
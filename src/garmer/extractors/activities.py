@@ -5,6 +5,7 @@ from datetime import date, datetime, timedelta
 from typing import Any
 
 from garmer.auth import GarminAuth
+from garmer.cache import RequestCoalescer
 from garmer.extractors.base import BaseExtractor
 from garmer.models import Activity, Lap
 
@@ -14,9 +15,9 @@ logger = logging.getLogger(__name__)
 class ActivityExtractor(BaseExtractor[Activity]):
     """Extractor for Garmin fitness activities."""
 
-    def __init__(self, auth: GarminAuth):
+    def __init__(self, auth: GarminAuth, coalescer: RequestCoalescer | None = None):
         """Initialize the activity extractor."""
-        super().__init__(auth)
+        super().__init__(auth, coalescer)
 
     def get_for_date(self, target_date: date | datetime | str) -> Activity | None:
         """
@@ -1,18 +1,33 @@
 """Base extractor class for Garmin data extraction."""
 
+import functools
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from functools import partial
 from typing import Any, Generic, TypeVar
 
-import garth
-
 from garmer.auth import GarminAuth
+from garmer.cache import RequestCoalescer
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Longest range the daily stats endpoints accept in one request
+STATS_RANGE_DAYS = 28
+
+# Maximum number of per-day requests in flight for date ranges, across all
+# extractors (they share one worker pool)
+RANGE_WORKERS = 8
+
+
+@functools.cache
+def _range_executor() -> ThreadPoolExecutor:
+    """Get the worker pool used to fetch the days of a date range."""
+    return ThreadPoolExecutor(max_workers=RANGE_WORKERS, thread_name_prefix="garmer-range")
+
 
 class BaseExtractor(ABC, Generic[T]):
     """
@@ -21,14 +36,17 @@ class BaseExtractor(ABC, Generic[T]):
     Provides common functionality for making API requests and handling dates.
     """
 
-    def __init__(self, auth: GarminAuth):
+    def __init__(self, auth: GarminAuth, coalescer: RequestCoalescer | None = None):
         """
         Initialize the extractor.
 
         Args:
             auth: Authenticated GarminAuth instance
+            coalescer: Optional coalescer shared with other extractors so that
+                       overlapping GET requests are only sent once
         """
         self.auth = auth
+        self._coalescer = coalescer
         self._username: str | None = None
 
     def _ensure_authenticated(self) -> None:
@@ -43,6 +61,8 @@ class BaseExtractor(ABC, Generic[T]):
         Required for certain API endpoints that include username in the path.
         """
         if self._username is None:
+            import garth
+
             self._ensure_authenticated()
             self._username = garth.client.username
         return self._username
@@ -64,8 +84,15 @@ class BaseExtractor(ABC, Generic[T]):
         Returns:
             The response data
         """
+        import garth
+
         self._ensure_authenticated()
-        return garth.connectapi(endpoint, method=method, **kwargs)
+        if self._coalescer is None or method != "GET":
+            return garth.connectapi(endpoint, method=method, **kwargs)
+        return self._coalescer.fetch(
+            (endpoint, repr(sorted(kwargs.items()))),
+            partial(garth.connectapi, endpoint, method=method, **kwargs),
+        )
 
     @staticmethod
     def _format_date(d: date | datetime | str) -> str:
@@ -97,6 +124,23 @@ class BaseExtractor(ABC, Generic[T]):
         """
         return datetime.strptime(date_str, "%Y-%m-%d").date()
 
+    @staticmethod
+    def _to_date(d: date | datetime | str) -> date:
+        """
+        Normalize a date-like value to a date.
+
+        Args:
+            d: Date, datetime, or YYYY-MM-DD string
+
+        Returns:
+            The corresponding date
+        """
+        if isinstance(d, str):
+            return BaseExtractor._parse_date(d)
+        if isinstance(d, datetime):
+            return d.date()
+        return d
+
     @staticmethod
     def _get_date_range(
         start_date: date | datetime | str,
@@ -136,6 +180,50 @@ class BaseExtractor(ABC, Generic[T]):
             yield current
             current += timedelta(days=1)
 
+    @staticmethod
+    def _date_windows(
+        start_date: date,
+        end_date: date,
+        max_days: int,
+    ) -> list[tuple[str, str]]:
+        """
+        Split a date range into windows for ranged endpoints.
+
+        Args:
+            start_date: Start date
+            end_date: End date (inclusive)
+            max_days: Maximum number of days per window
+
+        Returns:
+            List of (start, end) date strings covering the range in order
+        """
+        windows = []
+        window_start = start_date
+        while window_start <= end_date:
+            window_end = min(window_start + timedelta(days=max_days - 1), end_date)
+            windows.append((window_start.isoformat(), window_end.isoformat()))
+            window_start = window_end + timedelta(days=1)
+        return windows
+
+    def dates_in_range(
+        self,
+        start_date: date | datetime | str,
+        end_date: date | datetime | str,
+    ) -> list[date]:
+        """
+        List each date in a range.
+
+        Args:
+            start_date: Start date
+            end_date: End date (inclusive)
+
+        Returns:
+            List of dates from start_date to end_date
+        """
+        return list(
+            self._date_range_iterator(self._to_date(start_date), self._to_date(end_date))
+        )
+
     @abstractmethod
     def get_for_date(self, target_date: date | datetime | str) -> T | None:
         """
@@ -157,37 +245,64 @@ class BaseExtractor(ABC, Generic[T]):
         """
         Get data for a date range.
 
+        The days are requested concurrently (at most RANGE_WORKERS at a
+        time), so a range takes about as long as its slowest few requests.
+        Extractors whose endpoint accepts a range override this.
+
         Args:
             start_date: Start date
             end_date: End date
 
         Returns:
-            List of extracted data for each date in the range
-        """
-        start = (
-            self._parse_date(start_date)
-            if isinstance(start_date, str)
-            else (
-                start_date.date() if isinstance(start_date, datetime) else start_date
-            )
-        )
-        end = (
-            self._parse_date(end_date)
-            if isinstance(end_date, str)
-            else end_date.date() if isinstance(end_date, datetime) else end_date
-        )
+            List of extracted data for each date with data, in date order
+        """
+        days = self.dates_in_range(start_date, end_date)
+        return [data for data in _range_executor().map(self._get_for_day, days) if data]
+
+    def _get_for_day(self, d: date) -> T | None:
+        """Get data for one day of a range, logging failures."""
+        try:
+            return self.get_for_date(d)
+        except Exception as e:
+            logger.warning(f"Failed to get data for {d}: {e}")
+            return None
+
+    def _get_daily_stats(
+        self,
+        metric: str,
+        start_date: date | datetime | str,
+        end_date: date | datetime | str,
+    ) -> list[dict[str, Any]]:
+        """
+        Get per-day entries for a metric from the ranged daily stats endpoint.
+
+        The range is requested in windows of at most STATS_RANGE_DAYS days.
+        A window that fails is logged and skipped.
 
-        results = []
-        for d in self._date_range_iterator(start, end):
+        Args:
+            metric: Metric name in the endpoint path (e.g. "stress")
+            start_date: Start date
+            end_date: End date
+
+        Returns:
+            List of raw per-day entries, in date order
+        """
+        entries = []
+        windows = self._date_windows(
+            self._to_date(start_date), self._to_date(end_date), STATS_RANGE_DAYS
+        )
+        for start, end in windows:
             try:
-                data = self.get_for_date(d)
-                if data:
-                    results.append(data)
+                response = self._make_request(
+                    f"/usersummary-service/stats/{metric}/daily/{start}/{end}",
+                )
             except Exception as e:
-                logger.warning(f"Failed to get data for {d}: {e}")
+                logger.warning(f"Failed to get {metric} data for {start} to {end}: {e}")
                 continue
+            if response and isinstance(response, list):
+                entries.extend(response)
 
-        return results
+        return entries
 
     def get_today(self) -> T | None:
         """Get data for today."""
@@ -4,6 +4,7 @@ import logging
 from datetime import date, datetime
 
 from garmer.auth import GarminAuth
+from garmer.cache import RequestCoalescer
 from garmer.extractors.base import BaseExtractor
 from garmer.models import BodyComposition, Weight, HydrationData, RespirationData
 
@@ -13,9 +14,9 @@ logger = logging.getLogger(__name__)
 class BodyExtractor(BaseExtractor[BodyComposition]):
     """Extractor for Garmin body composition, weight, hydration, and respiration data."""
 
-    def __init__(self, auth: GarminAuth):
+    def __init__(self, auth: GarminAuth, coalescer: RequestCoalescer | None = None):
         """Initialize the body extractor."""
-        super().__init__(auth)
+        super().__init__(auth, coalescer)
 
     def get_for_date(
         self,
@@ -208,15 +209,16 @@ class BodyExtractor(BaseExtractor[BodyComposition]):
                 "weight_change_kg": None,
             }
 
+        # weight_kg is computed on access, so read it once per measurement
         weight_kgs = [w.weight_kg for w in weights]
 
         return {
             "measurements": len(weights),
-            "start_weight_kg": weights[0].weight_kg,
-            "end_weight_kg": weights[-1].weight_kg,
+            "start_weight_kg": weight_kgs[0],
+            "end_weight_kg": weight_kgs[-1],
             "min_weight_kg": min(weight_kgs),
             "max_weight_kg": max(weight_kgs),
             "avg_weight_kg": sum(weight_kgs) / len(weight_kgs),
-            "weight_change_kg": weights[-1].weight_kg - weights[0].weight_kg,
+            "weight_change_kg": weight_kgs[-1] - weight_kgs[0],
             "weights": weights,
         }
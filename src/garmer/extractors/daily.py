@@ -4,6 +4,7 @@ import logging
 from datetime import date, datetime, timedelta
 
 from garmer.auth import GarminAuth
+from garmer.cache import RequestCoalescer
 from garmer.extractors.base import BaseExtractor
 from garmer.models import DailySummary
 
@@ -13,9 +14,9 @@ logger = logging.getLogger(__name__)
 class DailyExtractor(BaseExtractor[DailySummary]):
     """Extractor for Garmin daily summary data."""
 
-    def __init__(self, auth: GarminAuth):
+    def __init__(self, auth: GarminAuth, coalescer: RequestCoalescer | None = None):
         """Initialize the daily summary extractor."""
-        super().__init__(auth)
+        super().__init__(auth, coalescer)
 
     def get_for_date(self, target_date: date | datetime | str) -> DailySummary | None:
         """
@@ -70,20 +71,18 @@ class DailyExtractor(BaseExtractor[DailySummary]):
         if not daily_data:
             return {"days_with_data": 0}
 
+        totals = self._totals(daily_data)
         return {
             "days_with_data": len(daily_data),
-            "total_steps": sum(d.total_steps for d in daily_data),
-            "avg_steps": sum(d.total_steps for d in daily_data) / len(daily_data),
-            "total_calories": sum(d.total_kilocalories for d in daily_data),
-            "total_active_calories": sum(d.active_kilocalories for d in daily_data),
-            "total_distance_km": sum(d.total_distance_meters for d in daily_data) / 1000,
-            "avg_resting_hr": self._avg([d.resting_heart_rate for d in daily_data]),
-            "avg_stress": self._avg([d.avg_stress_level for d in daily_data]),
-            "total_floors": sum(d.floors_ascended for d in daily_data),
-            "total_intensity_minutes": sum(
-                d.moderate_intensity_minutes + (2 * d.vigorous_intensity_minutes)
-                for d in daily_data
-            ),
+            "total_steps": totals["steps"],
+            "avg_steps": totals["steps"] / len(daily_data),
+            "total_calories": totals["calories"],
+            "total_active_calories": totals["active_calories"],
+            "total_distance_km": totals["distance_meters"] / 1000,
+            "avg_resting_hr": totals["avg_resting_hr"],
+            "avg_stress": totals["avg_stress"],
+            "total_floors": totals["floors"],
+            "total_intensity_minutes": totals["intensity_minutes"],
             "daily_summaries": daily_data,
         }
 
@@ -118,20 +117,52 @@ class DailyExtractor(BaseExtractor[DailySummary]):
         if not daily_data:
             return {"days_with_data": 0}
 
+        totals = self._totals(daily_data)
         return {
             "year": year,
             "month": month,
             "days_with_data": len(daily_data),
-            "total_steps": sum(d.total_steps for d in daily_data),
-            "avg_steps": sum(d.total_steps for d in daily_data) / len(daily_data),
-            "total_calories": sum(d.total_kilocalories for d in daily_data),
-            "total_distance_km": sum(d.total_distance_meters for d in daily_data) / 1000,
-            "avg_resting_hr": self._avg([d.resting_heart_rate for d in daily_data]),
-            "avg_stress": self._avg([d.avg_stress_level for d in daily_data]),
+            "total_steps": totals["steps"],
+            "avg_steps": totals["steps"] / len(daily_data),
+            "total_calories": totals["calories"],
+            "total_distance_km": totals["distance_meters"] / 1000,
+            "avg_resting_hr": totals["avg_resting_hr"],
+            "avg_stress": totals["avg_stress"],
         }
 
     @staticmethod
-    def _avg(values: list) -> float | None:
-        """Calculate average of non-None values."""
-        valid = [v for v in values if v is not None]
-        return sum(valid) / len(valid) if valid else None
+    def _totals(daily_data: list[DailySummary]) -> dict:
+        """
+        Sum the summary fields of several days in a single pass.
+
+        Resting heart rate and stress are averaged over the days that
+        report them, and are None when no day does.
+        """
+        steps = calories = active_calories = distance_meters = 0
+        floors = 0.0
+        intensity_minutes = 0
+        rhr_sum = rhr_count = stress_sum = stress_count = 0
+        for d in daily_data:
+            steps += d.total_steps
+            calories += d.total_kilocalories
+            active_calories += d.active_kilocalories
+            distance_meters += d.total_distance_meters
+            floors += d.floors_ascended
+            intensity_minutes += d.moderate_intensity_minutes + 2 * d.vigorous_intensity_minutes
+            if d.resting_heart_rate is not None:
+                rhr_sum += d.resting_heart_rate
+                rhr_count += 1
+            if d.avg_stress_level is not None:
+                stress_sum += d.avg_stress_level
+                stress_count += 1
+
+        return {
+            "steps": steps,
+            "calories": calories,
+            "active_calories": active_calories,
+            "distance_meters": distance_meters,
+            "floors": floors,
+            "intensity_minutes": intensity_minutes,
+            "avg_resting_hr": rhr_sum / rhr_count if rhr_count else None,
+            "avg_stress": stress_sum / stress_count if stress_count else None,
+        }
@@ -4,6 +4,7 @@ import logging
 from datetime import date, datetime
 
 from garmer.auth import GarminAuth
+from garmer.cache import RequestCoalescer
 from garmer.extractors.base import BaseExtractor
 from garmer.models import HeartRateData
 
@@ -13,9 +14,9 @@ logger = logging.getLogger(__name__)
 class HeartRateExtractor(BaseExtractor[HeartRateData]):
     """Extractor for Garmin heart rate data."""
 
-    def __init__(self, auth: GarminAuth):
+    def __init__(self, auth: GarminAuth, coalescer: RequestCoalescer | None = None):
         """Initialize the heart rate extractor."""
-        super().__init__(auth)
+        super().__init__(auth, coalescer)
 
     def get_for_date(self, target_date: date | datetime | str) -> HeartRateData | None:
         """
@@ -4,6 +4,7 @@ import logging
 from datetime import date, datetime
 
 from garmer.auth import GarminAuth
+from garmer.cache import RequestCoalescer
 from garmer.extractors.base import BaseExtractor
 from garmer.models import StressData
 
@@ -13,9 +14,9 @@ logger = logging.getLogger(__name__)
 class StressExtractor(BaseExtractor[StressData]):
     """Extractor for Garmin stress data."""
 
-    def __init__(self, auth: GarminAuth):
+    def __init__(self, auth: GarminAuth, coalescer: RequestCoalescer | None = None):
         """Initialize the stress extractor."""
-        super().__init__(auth)
+        super().__init__(auth, coalescer)
 
     def get_for_date(self, target_date: date | datetime | str) -> StressData | None:
         """
@@ -40,6 +41,29 @@ class StressExtractor(BaseExtractor[StressData]):
             logger.error(f"Failed to get stress data for {date_str}: {e}")
             return None
 
+    def get_for_date_range(
+        self,
+        start_date: date | datetime | str,
+        end_date: date | datetime | str,
+    ) -> list[StressData]:
+        """
+        Get stress data for a date range.
+
+        Uses the ranged stats endpoint, so a range takes one request per
+        STATS_RANGE_DAYS days instead of one per day.
+
+        Args:
+            start_date: Start date
+            end_date: End date
+
+        Returns:
+            List of stress data for each date with data, in date order
+        """
+        return [
+            StressData.from_garmin_response(day)
+            for day in self._get_daily_stats("stress", start_date, end_date)
+        ]
+
     def get_stress_timeseries(
         self,
         target_date: date | datetime | str,
@@ -95,6 +95,17 @@ class BodyComposition(GarminBaseModel):
             raw_data=data,
         )
 
+    @classmethod
+    def from_weight(cls, weight: Weight) -> "BodyComposition":
+        """Create a weight-only body composition from a weight measurement."""
+        return cls(
+            sample_pk=weight.sample_pk,
+            date=weight.date,
+            timestamp=weight.timestamp,
+            weight_grams=weight.weight_grams,
+            source_type=weight.source_type,
+        )
+
     @property
     def weight_kg(self) -> float:
         """Get weight in kilograms."""
@@ -19,6 +19,10 @@ class SleepLevel(str, Enum):
     UNMEASURABLE = "unmeasurable"
 
 
+# Raw sleepLevel values mapped once at import rather than per phase
+_SLEEP_LEVELS = {level.value: level for level in SleepLevel}
+
+
 class SleepPhase(GarminBaseModel):
     """Represents a phase/segment within a sleep session."""
 
@@ -30,14 +34,8 @@ class SleepPhase(GarminBaseModel):
     @classmethod
     def from_garmin_response(cls, data: dict[str, Any]) -> "SleepPhase":
         """Parse sleep phase from Garmin response."""
-        level_map = {
-            "deep": SleepLevel.DEEP,
-            "light": SleepLevel.LIGHT,
-            "rem": SleepLevel.REM,
-            "awake": SleepLevel.AWAKE,
-        }
         raw_level = data.get("sleepLevel", "unmeasurable").lower()
-        level = level_map.get(raw_level, SleepLevel.UNMEASURABLE)
+        level = _SLEEP_LEVELS.get(raw_level, SleepLevel.UNMEASURABLE)
 
         return cls(
             start_time=parse_garmin_timestamp(data.get("startGMT")),
@@ -134,17 +132,13 @@ class SleepData(GarminBaseModel):
     @classmethod
     def from_garmin_response(cls, data: dict[str, Any]) -> "SleepData":
         """Parse sleep data from Garmin API response."""
-        # Parse sleep phases if available
-        sleep_phases = []
-        raw_phases = data.get("sleepLevels", [])
-        for phase_data in raw_phases:
-            sleep_phases.append(SleepPhase.from_garmin_response(phase_data))
-
-        # Parse sleep movements if available
-        sleep_movements = []
-        raw_movements = data.get("sleepMovement", [])
-        for movement_data in raw_movements:
-            sleep_movements.append(SleepMovement.from_garmin_response(movement_data))
+        # Parse sleep phases and movements if available
+        sleep_phases = [
+            SleepPhase.from_garmin_response(p) for p in data.get("sleepLevels", [])
+        ]
+        sleep_movements = [
+            SleepMovement.from_garmin_response(m) for m in data.get("sleepMovement", [])
+        ]
 
         # Handle nested sleep scores
         sleep_scores = data.get("sleepScores", {})